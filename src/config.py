@@ -1,13 +1,87 @@
 import os
+import sys
+import queue
+import atexit
 import logging
+import logging.handlers
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_BATCH_MAX_RECORDS = 256
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that holds formatted records until the log queue drains.
+
+    While more records are waiting in the queue, each one is only appended to
+    an in-memory batch; the batch is written to the stream in a single write()
+    once the queue is empty or LOG_BATCH_MAX_RECORDS records have piled up.
+    """
+
+    def __init__(self, stream, pending):
+        super().__init__(stream)
+        self._pending = pending
+        self._batch = []
+
+    def emit(self, record):
+        try:
+            self._batch.append(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+            return
+        if self._pending.empty() or len(self._batch) >= LOG_BATCH_MAX_RECORDS:
+            self.flush()
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self._batch:
+                self.stream.write("".join(self._batch))
+                self._batch.clear()
+            super().flush()
+        finally:
+            self.release()
+
+
+# Configure logging to stderr so it doesn't interfere with MCP protocol.
+# The QueueHandler still merges msg % args on the calling thread, but applying
+# LOG_FORMAT (timestamps included) and the write syscalls happen on a
+# background listener thread instead of the asyncio event loop.
+_log_queue = queue.SimpleQueue()
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# Without an explicit formatter basicConfig would give the queue handler its
+# "LEVEL:name:message" default, and records would be formatted twice
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+_stderr_handler = _BufferedStreamHandler(sys.stderr, _log_queue)
+_stderr_handler.setFormatter(logging.Formatter(LOG_FORMAT))
 
-# Configure logging to stderr so it doesn't interfere with MCP protocol
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler()]
+    handlers=[_queue_handler]
 )
 
+# basicConfig is a no-op when the root logger is already configured (e.g. on
+# module reload), so only start a listener if our queue handler was installed
+if _queue_handler in logging.getLogger().handlers:
+    _log_listener = logging.handlers.QueueListener(_log_queue, _stderr_handler, respect_handler_level=True)
+    _log_listener.start()
+    # atexit runs handlers in reverse order: stop the listener, then write out
+    # whatever was still batched when the stop sentinel arrived
+    atexit.register(_stderr_handler.flush)
+    atexit.register(_log_listener.stop)
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment"""
+    value = os.environ.get(name)
+    return default if value is None else int(value)
+
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    """Read a boolean setting from the environment; only "true" (any case) is truthy"""
+    value = os.environ.get(name)
+    return default if value is None else value.lower() == "true"
+
+
 # MCP Configuration
 MCP_TRANSPORT = os.environ.get("MCP_TRANSPORT", "stdio")
 FASTMCP_HOST = os.environ.get("FASTMCP_HOST", "0.0.0.0")
@@ -44,23 +118,29 @@ else:
     SNOWFLAKE_TOKEN = None
 
 # Prometheus metrics configuration
-ENABLE_METRICS = os.environ.get("ENABLE_METRICS", "false").lower() == "true"
-METRICS_PORT = int(os.environ.get("METRICS_PORT", "8000"))
+ENABLE_METRICS = _env_bool("ENABLE_METRICS")
+METRICS_PORT = _env_int("METRICS_PORT", 8000)
 
 # Performance configuration
-ENABLE_CACHING = os.environ.get("ENABLE_CACHING", "true").lower() == "true"
-CACHE_TTL_SECONDS = int(os.environ.get("CACHE_TTL_SECONDS", "300"))  # 5 minutes
-CACHE_MAX_SIZE = int(os.environ.get("CACHE_MAX_SIZE", "1000"))
-MAX_HTTP_CONNECTIONS = int(os.environ.get("MAX_HTTP_CONNECTIONS", "20"))
-HTTP_TIMEOUT_SECONDS = int(os.environ.get("HTTP_TIMEOUT_SECONDS", "60"))
-THREAD_POOL_WORKERS = int(os.environ.get("THREAD_POOL_WORKERS", "10"))
-RATE_LIMIT_PER_SECOND = int(os.environ.get("RATE_LIMIT_PER_SECOND", "50"))
-CONCURRENT_QUERY_BATCH_SIZE = int(os.environ.get("CONCURRENT_QUERY_BATCH_SIZE", "5"))
-
-# Check if Prometheus is available
-try:
-    # These imports are used in metrics.py
-    from prometheus_client import Counter, Histogram, Gauge, CONTENT_TYPE_LATEST, generate_latest  # noqa: F401
-    PROMETHEUS_AVAILABLE = True
-except ImportError:
-    PROMETHEUS_AVAILABLE = False
+ENABLE_CACHING = _env_bool("ENABLE_CACHING", True)
+CACHE_TTL_SECONDS = _env_int("CACHE_TTL_SECONDS", 300)  # 5 minutes
+CACHE_MAX_SIZE = _env_int("CACHE_MAX_SIZE", 1000)
+MAX_HTTP_CONNECTIONS = _env_int("MAX_HTTP_CONNECTIONS", 20)
+HTTP_TIMEOUT_SECONDS = _env_int("HTTP_TIMEOUT_SECONDS", 60)
+HTTP_RETRY_ATTEMPTS = max(1, _env_int("HTTP_RETRY_ATTEMPTS", 3))  # total tries for transient API failures
+THREAD_POOL_WORKERS = _env_int("THREAD_POOL_WORKERS", 10)
+RATE_LIMIT_PER_SECOND = _env_int("RATE_LIMIT_PER_SECOND", 50)
+CONCURRENT_QUERY_BATCH_SIZE = _env_int("CONCURRENT_QUERY_BATCH_SIZE", 5)
+CIRCUIT_BREAKER_THRESHOLD = _env_int("CIRCUIT_BREAKER_THRESHOLD", 5)  # 0 disables the breaker
+CIRCUIT_BREAKER_COOLDOWN_SECONDS = _env_int("CIRCUIT_BREAKER_COOLDOWN_SECONDS", 30)
+
+# Check if Prometheus is available. Only probe when metrics are enabled so the
+# default (metrics disabled) startup path never imports prometheus_client.
+PROMETHEUS_AVAILABLE = False
+if ENABLE_METRICS:
+    try:
+        # These imports are used in metrics.py
+        from prometheus_client import Counter, Histogram, Gauge, CONTENT_TYPE_LATEST, generate_latest  # noqa: F401
+        PROMETHEUS_AVAILABLE = True
+    except ImportError:
+        PROMETHEUS_AVAILABLE = False
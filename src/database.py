@@ -1,11 +1,19 @@
 import json
+import re
 import time
+import hashlib
+import random
 import logging
 import asyncio
 import threading
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from operator import itemgetter
 from datetime import datetime, timezone, timedelta
-from typing import Any, List, Dict, Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, DefaultDict, Hashable, List, Dict, Mapping, Optional, Sequence, Tuple
 
 import httpx
 from cachetools import TTLCache
@@ -19,6 +27,12 @@ except ImportError:
     SNOWFLAKE_CONNECTOR_AVAILABLE = False
     SnowflakeError = Exception
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from config import (
     SNOWFLAKE_BASE_URL,
     SNOWFLAKE_ACCOUNT,
@@ -43,7 +57,10 @@ from config import (
     HTTP_TIMEOUT_SECONDS,
     THREAD_POOL_WORKERS,
     RATE_LIMIT_PER_SECOND,
-    CONCURRENT_QUERY_BATCH_SIZE
+    CONCURRENT_QUERY_BATCH_SIZE,
+    CIRCUIT_BREAKER_THRESHOLD,
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+    HTTP_RETRY_ATTEMPTS
 )
 from metrics import track_snowflake_query
 
@@ -54,8 +71,89 @@ _connection_pool = None
 _cache = TTLCache(maxsize=CACHE_MAX_SIZE, ttl=CACHE_TTL_SECONDS) if ENABLE_CACHING else None
 _cache_lock = threading.RLock()
 _throttler = Throttler(rate_limit=RATE_LIMIT_PER_SECOND, period=1.0)
+_inflight_queries: Dict[str, asyncio.Future] = {}
+_circuit_breaker = None
 _thread_pool = ThreadPoolExecutor(max_workers=THREAD_POOL_WORKERS, thread_name_prefix="snowflake-worker")
 
+# Expands a JSON array bound to '?' into one row per issue ID for use in an IN clause
+ISSUE_ID_LIST_SQL = "SELECT VALUE::STRING FROM TABLE(FLATTEN(INPUT => PARSE_JSON(?)))"
+
+# Enrichment queries; their text never changes, only the bound ID array does
+LABELS_SQL = f"""
+    SELECT ISSUE, LABEL
+    FROM {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_LABEL_RHAI
+    WHERE ISSUE IN ({ISSUE_ID_LIST_SQL}) AND LABEL IS NOT NULL
+    """
+
+COMMENTS_SQL = f"""
+    SELECT ID, ISSUEID, ROLELEVEL, BODY, CREATED, UPDATED
+    FROM {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_COMMENT_NON_PII
+    WHERE ISSUEID IN ({ISSUE_ID_LIST_SQL}) AND BODY IS NOT NULL
+    ORDER BY ISSUEID, CREATED ASC
+    """
+
+LINKS_SQL = f"""
+    SELECT
+        il.ID as LINK_ID,
+        il.SOURCE,
+        il.DESTINATION,
+        il.SEQUENCE,
+        ilt.LINKNAME,
+        ilt.INWARD,
+        ilt.OUTWARD,
+        si.ISSUE_KEY as SOURCE_KEY,
+        di.ISSUE_KEY as DESTINATION_KEY,
+        si.SUMMARY as SOURCE_SUMMARY,
+        di.SUMMARY as DESTINATION_SUMMARY
+    FROM {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_ISSUELINK_RHAI il
+    JOIN {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_ISSUELINKTYPE_RHAI ilt
+        ON il.LINKTYPE = ilt.ID
+    LEFT JOIN {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_ISSUE_NON_PII si
+        ON il.SOURCE = si.ID
+    LEFT JOIN {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_ISSUE_NON_PII di
+        ON il.DESTINATION = di.ID
+    WHERE (il.SOURCE IN ({ISSUE_ID_LIST_SQL}) OR il.DESTINATION IN ({ISSUE_ID_LIST_SQL}))
+    ORDER BY il.SOURCE, il.SEQUENCE
+    """
+
+STATUS_CHANGES_SQL = f"""
+    SELECT
+        ji.issue_key,
+        cg.created as change_timestamp,
+        old_status.pname as from_status,
+        new_status.pname as to_status,
+        CONCAT(old_status.pname, ' → ', new_status.pname) as status_transition
+    FROM {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_CHANGEGROUP_RHAI cg
+    JOIN {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_CHANGEITEM_NON_PII ci ON cg.id = ci.groupid
+    JOIN {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_ISSUE_NON_PII ji ON cg.issueid = ji.id
+    LEFT JOIN {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_ISSUESTATUS_RHAI old_status ON ci.oldvalue = old_status.id
+    LEFT JOIN {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_ISSUESTATUS_RHAI new_status ON ci.newvalue = new_status.id
+    WHERE ci.field = 'status'
+      AND ji.id IN ({ISSUE_ID_LIST_SQL})
+    ORDER BY ji.issue_key, cg.created ASC
+    """
+
+# Transient API responses worth retrying. Partition GETs are idempotent. A POST is
+# only re-sent on 429, which the SQL API returns when it refuses a request for rate
+# limiting; a 503 may come from a proxy after the statement was already submitted.
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+RESENDABLE_STATUS_CODES = frozenset({429})
+RETRY_BASE_DELAY_SECONDS = 0.05
+
+# Columns selected by LINKS_SQL, in order
+LINK_COLUMNS = (
+    "LINK_ID", "SOURCE", "DESTINATION", "SEQUENCE", "LINKNAME",
+    "INWARD", "OUTWARD", "SOURCE_KEY", "DESTINATION_KEY",
+    "SOURCE_SUMMARY", "DESTINATION_SUMMARY"
+)
+_get_link_fields = itemgetter(*LINK_COLUMNS)
+
+# Date/time columns whose values are converted to ISO timestamps
+TIMESTAMP_COLUMNS = frozenset({
+    'CREATED', 'UPDATED', 'DUEDATE', 'RESOLUTIONDATE',
+    'ARCHIVEDDATE', '_FIVETRAN_SYNCED', 'CHANGE_TIMESTAMP'
+})
+
 
 class SnowflakeConnectionPool:
     """Connection pool for Snowflake API requests"""
@@ -68,6 +166,10 @@ class SnowflakeConnectionPool:
 
     async def get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client with connection pooling"""
+        # Fast path: every request after the first finds a live client without queueing on the lock
+        client = self._client
+        if client is not None and not client.is_closed:
+            return client
         async with self._lock:
             if self._client is None or self._client.is_closed:
                 limits = httpx.Limits(
@@ -84,7 +186,7 @@ class SnowflakeConnectionPool:
                         verify=True
                     )
                 )
-                logger.info(f"Created new HTTP client with {self.max_connections} max connections")
+                logger.info("Created new HTTP client with %d max connections", self.max_connections)
             return self._client
 
     async def close(self):
@@ -95,6 +197,56 @@ class SnowflakeConnectionPool:
                 logger.info("Closed HTTP connection pool")
 
 
+class CircuitBreaker:
+    """Fail fast on Snowflake API requests after repeated consecutive failures"""
+
+    def __init__(self, threshold: int = CIRCUIT_BREAKER_THRESHOLD, cooldown: float = CIRCUIT_BREAKER_COOLDOWN_SECONDS):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._open_until = 0.0
+
+    def is_open(self) -> bool:
+        """Return True while requests should be rejected without touching the network
+
+        Once the cooldown has passed the breaker is half-open: the first caller
+        is let through as a probe and everyone else is rejected until it
+        records a success or failure, or another cooldown passes without either.
+        """
+        now = time.monotonic()
+        if now < self._open_until:
+            return True
+        if self.threshold > 0 and self._failures >= self.threshold:
+            self._open_until = now + self.cooldown
+        return False
+
+    def record_success(self) -> None:
+        """Close the breaker after a request got through"""
+        self._failures = 0
+        self._open_until = 0.0
+
+    def record_failure(self) -> None:
+        """Count a failed request and open the breaker once the threshold is reached"""
+        if self.threshold <= 0:
+            return
+        self._failures += 1
+        # A failed half-open probe is still over the threshold, so this reopens at once
+        if self._failures >= self.threshold:
+            self._open_until = time.monotonic() + self.cooldown
+            logger.warning(
+                "Snowflake API failed %d times in a row, rejecting requests for %ss",
+                self._failures, self.cooldown
+            )
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Get the global circuit breaker for Snowflake API requests"""
+    global _circuit_breaker
+    if _circuit_breaker is None:
+        _circuit_breaker = CircuitBreaker()
+    return _circuit_breaker
+
+
 def get_connection_pool() -> SnowflakeConnectionPool:
     """Get the global connection pool instance"""
     global _connection_pool
@@ -123,13 +275,16 @@ class SnowflakeConnectorPool:
             'database': SNOWFLAKE_DATABASE,
             'schema': SNOWFLAKE_SCHEMA,
             'warehouse': SNOWFLAKE_WAREHOUSE,
+            # Server-side '?' binding, matching the SQL API bindings
+            'paramstyle': 'qmark',
         }
 
         if SNOWFLAKE_ROLE:
             conn_params['role'] = SNOWFLAKE_ROLE
 
         # Authentication methods
-        if SNOWFLAKE_AUTHENTICATOR.lower() == 'snowflake_jwt':
+        authenticator = SNOWFLAKE_AUTHENTICATOR.lower()
+        if authenticator == 'snowflake_jwt':
             # Key pair authentication
             conn_params['authenticator'] = 'SNOWFLAKE_JWT'
             conn_params['user'] = SNOWFLAKE_USER
@@ -140,7 +295,7 @@ class SnowflakeConnectorPool:
             else:
                 raise ValueError("SNOWFLAKE_PRIVATE_KEY_FILE is required for JWT authentication")
 
-        elif SNOWFLAKE_AUTHENTICATOR.lower() == 'oauth_client_credentials':
+        elif authenticator == 'oauth_client_credentials':
             # OAuth client credentials flow
             conn_params['authenticator'] = 'OAUTH_CLIENT_CREDENTIALS'
             if SNOWFLAKE_OAUTH_CLIENT_ID and SNOWFLAKE_OAUTH_CLIENT_SECRET:
@@ -151,7 +306,7 @@ class SnowflakeConnectorPool:
             else:
                 raise ValueError("SNOWFLAKE_OAUTH_CLIENT_ID and SNOWFLAKE_OAUTH_CLIENT_SECRET are required for OAuth")
 
-        elif SNOWFLAKE_AUTHENTICATOR.lower() == 'oauth':
+        elif authenticator == 'oauth':
             # OAuth with existing access token
             from config import SNOWFLAKE_TOKEN
             conn_params['authenticator'] = 'OAUTH'
@@ -176,9 +331,9 @@ class SnowflakeConnectorPool:
                 try:
                     conn_params = self._build_connection_params()
                     self._connection = snowflake.connector.connect(**conn_params)
-                    logger.info(f"Created new Snowflake connector connection to {SNOWFLAKE_ACCOUNT}")
+                    logger.info("Created new Snowflake connector connection to %s", SNOWFLAKE_ACCOUNT)
                 except Exception as e:
-                    logger.error(f"Failed to create Snowflake connection: {str(e)}")
+                    logger.error("Failed to create Snowflake connection: %s", e)
                     raise
             return self._connection
 
@@ -190,7 +345,7 @@ class SnowflakeConnectorPool:
                     self._connection.close()
                     logger.info("Closed Snowflake connector connection")
                 except Exception as e:
-                    logger.error(f"Error closing Snowflake connection: {str(e)}")
+                    logger.error("Error closing Snowflake connection: %s", e)
                 finally:
                     self._connection = None
 
@@ -216,7 +371,15 @@ def get_cache_key(operation: str, **kwargs) -> str:
     return ":".join(key_parts)
 
 
-def get_from_cache(key: str) -> Optional[Any]:
+_SELECT_RE = re.compile(r"\s*select\b", re.IGNORECASE)
+
+
+def _is_select(sql: str) -> bool:
+    """Return True if sql is a SELECT, matching its leading keyword without copying the statement"""
+    return _SELECT_RE.match(sql) is not None
+
+
+def get_from_cache(key: Hashable) -> Optional[Any]:
     """Get value from cache thread-safely"""
     if not ENABLE_CACHING or _cache is None:
         return None
@@ -224,7 +387,7 @@ def get_from_cache(key: str) -> Optional[Any]:
         return _cache.get(key)
 
 
-def set_in_cache(key: str, value: Any) -> None:
+def set_in_cache(key: Hashable, value: Any) -> None:
     """Set value in cache thread-safely"""
     if not ENABLE_CACHING or _cache is None:
         return
@@ -252,13 +415,37 @@ async def cleanup_resources():
     clear_cache()
 
 
-def sanitize_sql_value(value: str) -> str:
-    """Sanitize a SQL value to prevent injection attacks"""
-    if not isinstance(value, str):
-        return str(value)
-    # Remove or escape dangerous characters
-    # For string values, we'll escape single quotes by doubling them
-    return value.replace("'", "''")
+def build_query_bindings(params: Sequence[Any]) -> Dict[str, Dict[str, str]]:
+    """Convert positional query parameters into SQL API bindings"""
+    bindings = {}
+    for index, value in enumerate(params, start=1):
+        if isinstance(value, int) and not isinstance(value, bool):
+            bindings[str(index)] = {"type": "FIXED", "value": str(value)}
+        else:
+            bindings[str(index)] = {"type": "TEXT", "value": str(value)}
+    return bindings
+
+
+def _is_retryable(error: Exception, method: str) -> bool:
+    """Return True if a failed request can safely be sent again"""
+    if isinstance(error, httpx.HTTPStatusError):
+        status_codes = RETRYABLE_STATUS_CODES if method.upper() == "GET" else RESENDABLE_STATUS_CODES
+        return error.response.status_code in status_codes
+    # The transport already retries failed connects, so don't multiply them here;
+    # a POST that failed in transit may already have started a statement
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+        return False
+    return method.upper() == "GET" and isinstance(error, httpx.TransportError)
+
+
+@lru_cache(maxsize=16)
+def _build_request_headers(token: str) -> Mapping[str, str]:
+    """Build the read-only request headers for a token, shared across requests"""
+    return MappingProxyType({
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/json",
+        "Content-Type": "application/json"
+    })
 
 
 async def make_snowflake_request(
@@ -282,14 +469,16 @@ async def make_snowflake_request(
         cache_key = get_cache_key("api_request", endpoint=endpoint, data=str(data))
         cached_result = get_from_cache(cache_key)
         if cached_result is not None:
-            logger.debug(f"Cache hit for {endpoint}")
+            logger.debug("Cache hit for %s", endpoint)
             return cached_result
 
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
+    # Don't wait out another timeout while Snowflake is known to be failing
+    breaker = get_circuit_breaker()
+    if breaker.is_open():
+        logger.warning("Snowflake API circuit breaker is open, skipping request to %s", endpoint)
+        return None
+
+    headers = _build_request_headers(token)
 
     url = f"{SNOWFLAKE_BASE_URL}/{endpoint}"
 
@@ -299,40 +488,65 @@ async def make_snowflake_request(
             pool = get_connection_pool()
             client = await pool.get_client()
 
-            if method.upper() == "GET":
-                response = await client.request(method, url, headers=headers, params=data)
-            else:
-                response = await client.request(method, url, headers=headers, json=data)
+            for attempt in range(1, HTTP_RETRY_ATTEMPTS + 1):
+                try:
+                    if method.upper() == "GET":
+                        response = await client.request(method, url, headers=headers, params=data)
+                    elif ORJSON_AVAILABLE:
+                        # headers already carry Content-Type: application/json
+                        response = await client.request(method, url, headers=headers, content=orjson.dumps(data))
+                    else:
+                        response = await client.request(method, url, headers=headers, json=data)
+
+                    response.raise_for_status()
+                    break
+                except (httpx.HTTPStatusError, httpx.TransportError) as request_error:
+                    if attempt == HTTP_RETRY_ATTEMPTS or not _is_retryable(request_error, method):
+                        raise
+                    # Exponential backoff (50ms, 200ms, ...) with jitter so concurrent retries spread out
+                    delay = RETRY_BASE_DELAY_SECONDS * 4 ** (attempt - 1) + random.uniform(0, RETRY_BASE_DELAY_SECONDS)
+                    logger.warning(
+                        "Snowflake API request to %s failed (%s), retry %d/%d in %.2fs",
+                        endpoint, request_error, attempt, HTTP_RETRY_ATTEMPTS - 1, delay
+                    )
+                    await asyncio.sleep(delay)
 
-            response.raise_for_status()
+            breaker.record_success()
 
             # Try to parse JSON, but handle cases where response is not valid JSON
             try:
-                result = response.json()
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError, so one handler covers both
+                result = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
 
                 # Cache successful GET requests
                 if use_cache and cache_key and method.upper() == "GET":
                     set_in_cache(cache_key, result)
-                    logger.debug(f"Cached result for {endpoint}")
+                    logger.debug("Cached result for %s", endpoint)
 
                 return result
             except json.JSONDecodeError as json_error:
-                logger.error(f"Failed to parse JSON response from Snowflake API: {json_error}")
-                logger.error(f"Response content: {response.text[:500]}...")  # Log first 500 chars
+                logger.error("Failed to parse JSON response from Snowflake API: %s", json_error)
+                logger.error("Response content: %.500s...", response.text)  # Log first 500 chars
                 # Return None to indicate error, which will be handled by calling functions
                 return None
 
     except httpx.HTTPStatusError as http_error:
-        logger.error(f"HTTP error from Snowflake API: {http_error.response.status_code} - {http_error.response.text}")
+        logger.error("HTTP error from Snowflake API: %s - %s", http_error.response.status_code, http_error.response.text)
+        # Client errors such as an expired token say nothing about Snowflake's health
+        if http_error.response.status_code >= 500:
+            breaker.record_failure()
         return None
     except Exception as e:
-        logger.error(f"Unexpected error in Snowflake API request: {str(e)}")
+        logger.error("Unexpected error in Snowflake API request: %s", e)
+        if isinstance(e, httpx.TransportError):
+            breaker.record_failure()
         return None
 
 
 async def execute_snowflake_query_connector(
     sql: str,
-    use_cache: bool = True
+    use_cache: bool = True,
+    params: Optional[Sequence[Any]] = None
 ) -> List[Dict[str, Any]]:
     """Execute a SQL query using snowflake.connector"""
     start_time = time.time()
@@ -340,11 +554,11 @@ async def execute_snowflake_query_connector(
 
     # Check cache for SELECT queries
     cache_key = None
-    if use_cache and sql.strip().upper().startswith('SELECT'):
-        cache_key = get_cache_key("sql_query_connector", sql=sql)
+    if use_cache and _is_select(sql):
+        cache_key = get_cache_key("sql_query_connector", sql=sql, params=params)
         cached_result = get_from_cache(cache_key)
         if cached_result is not None:
-            logger.debug(f"Cache hit for connector SQL query: {sql[:50]}...")
+            logger.debug("Cache hit for connector SQL query: %.50s...", sql)
             track_snowflake_query(start_time, True)
             return cached_result
 
@@ -354,14 +568,14 @@ async def execute_snowflake_query_connector(
         try:
             # Execute in thread pool to avoid blocking async event loop
             loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(_thread_pool, _execute_connector_query_sync, sql)
+            result = await loop.run_in_executor(_thread_pool, _execute_connector_query_sync, sql, params)
 
             success = True
 
             # Cache successful SELECT results
             if use_cache and cache_key and result is not None:
                 set_in_cache(cache_key, result)
-                logger.debug(f"Cached connector SQL result: {sql[:50]}...")
+                logger.debug("Cached connector SQL result: %.50s...", sql)
 
             track_snowflake_query(start_time, success)
             return result if result is not None else []
@@ -369,16 +583,16 @@ async def execute_snowflake_query_connector(
         except SnowflakeError as e:
             error_code = getattr(e, 'errno', None)
             if error_code == 390114 and attempt < max_retries - 1:  # Token expired, retry once
-                logger.info(f"Token expired on attempt {attempt + 1}, retrying...")
+                logger.info("Token expired on attempt %d, retrying...", attempt + 1)
                 continue
             else:
-                logger.error(f"Error executing Snowflake connector query: {str(e)}")
-                logger.error(f"Query that failed: {sql}")
+                logger.error("Error executing Snowflake connector query: %s", e)
+                logger.error("Query that failed: %s", sql)
                 track_snowflake_query(start_time, False)
                 return []
         except Exception as e:
-            logger.error(f"Error executing Snowflake connector query: {str(e)}")
-            logger.error(f"Query that failed: {sql}")
+            logger.error("Error executing Snowflake connector query: %s", e)
+            logger.error("Query that failed: %s", sql)
             track_snowflake_query(start_time, False)
             return []
 
@@ -387,42 +601,44 @@ async def execute_snowflake_query_connector(
     return []
 
 
-def _execute_connector_query_sync(sql: str) -> List[Dict[str, Any]]:
+def _execute_connector_query_sync(sql: str, params: Optional[Sequence[Any]] = None) -> List[Dict[str, Any]]:
     """Execute query synchronously using snowflake.connector"""
     try:
         pool = get_connector_pool()
         conn = pool.get_connection()
 
-        logger.info(f"Executing Snowflake connector query: {sql[:100]}...")
+        logger.info("Executing Snowflake connector query: %.100s...", sql)
 
         cursor = conn.cursor()
-        cursor.execute(sql)
+        if params:
+            cursor.execute(sql, params)
+        else:
+            cursor.execute(sql)
 
         # Fetch results
         results = cursor.fetchall()
         columns = [desc[0] for desc in cursor.description] if cursor.description else []
 
-        logger.info(f"Successfully got {len(results)} rows from Snowflake connector")
+        logger.info("Successfully got %d rows from Snowflake connector", len(results))
+
+        # Resolve timestamp columns once per result set rather than per cell
+        timestamp_columns = [
+            (i, column_name) for i, column_name in enumerate(columns)
+            if column_name.upper() in TIMESTAMP_COLUMNS
+        ]
 
         # Convert to list of dictionaries
         formatted_results = []
         for row in results:
-            row_dict = {}
-            for i, value in enumerate(row):
-                if i < len(columns):
-                    column_name = columns[i]
-                    # Handle timestamp conversion
-                    timestamp_columns = {
-                        'CREATED', 'UPDATED', 'DUEDATE', 'RESOLUTIONDATE',
-                        'ARCHIVEDDATE', '_FIVETRAN_SYNCED', 'CHANGE_TIMESTAMP'
-                    }
-                    if column_name.upper() in timestamp_columns and value:
-                        if hasattr(value, 'isoformat'):
-                            row_dict[column_name] = value.isoformat()
-                        else:
-                            row_dict[column_name] = str(value)
+            row_dict = dict(zip(columns, row))
+            for i, column_name in timestamp_columns:
+                value = row[i] if i < len(row) else None
+                # Handle timestamp conversion
+                if value:
+                    if hasattr(value, 'isoformat'):
+                        row_dict[column_name] = value.isoformat()
                     else:
-                        row_dict[column_name] = value
+                        row_dict[column_name] = str(value)
             formatted_results.append(row_dict)
 
         cursor.close()
@@ -430,7 +646,7 @@ def _execute_connector_query_sync(sql: str) -> List[Dict[str, Any]]:
 
     except SnowflakeError as e:
         error_code = getattr(e, 'errno', None)
-        logger.error(f"Snowflake connector error: {str(e)}")
+        logger.error("Snowflake connector error: %s", e)
 
         # Handle token expiration errors by forcing connection refresh
         if error_code == 390114:  # Authentication token expired
@@ -440,32 +656,71 @@ def _execute_connector_query_sync(sql: str) -> List[Dict[str, Any]]:
 
         raise
     except Exception as e:
-        logger.error(f"Unexpected error in connector query: {str(e)}")
+        logger.error("Unexpected error in connector query: %s", e)
         raise
 
 
 async def execute_snowflake_query(
     sql: str,
     snowflake_token: Optional[str] = None,
-    use_cache: bool = True
+    use_cache: bool = True,
+    params: Optional[Sequence[Any]] = None
 ) -> List[Dict[str, Any]]:
-    """Execute a SQL query against Snowflake and return results with caching"""
+    """Execute a SQL query against Snowflake and return results with caching
+
+    Values in params are bound positionally to '?' placeholders in sql, so the
+    statement text stays the same across calls and Snowflake can reuse its plan.
+    Identical cacheable SELECTs that arrive while one is already running share
+    its result instead of issuing a second statement.
+    """
+    if not use_cache or not _is_select(sql):
+        return await _route_snowflake_query(sql, snowflake_token, use_cache, params)
+
+    # Only callers presenting the same token may share a statement, so a failing
+    # token cannot hand its empty result to a caller with a valid one
+    token_digest = hashlib.sha256(snowflake_token.encode()).hexdigest() if snowflake_token else None
+    inflight_key = get_cache_key("sql_inflight", sql=sql, params=params, token=token_digest)
+    task = _inflight_queries.get(inflight_key)
+    if task is None:
+        task = asyncio.ensure_future(_route_snowflake_query(sql, snowflake_token, use_cache, params))
+        _inflight_queries[inflight_key] = task
+        task.add_done_callback(lambda done: _finish_inflight_query(inflight_key, done))
+    else:
+        logger.debug("Joining in-flight SQL query: %.50s...", sql)
+    # Shield so one cancelled caller does not cancel the query for the others
+    return await asyncio.shield(task)
 
+
+def _finish_inflight_query(inflight_key: str, task: asyncio.Future) -> None:
+    """Drop a finished shared query and retrieve its error in case every caller was cancelled"""
+    _inflight_queries.pop(inflight_key, None)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug("Shared SQL query failed: %s", task.exception())
+
+
+async def _route_snowflake_query(
+    sql: str,
+    snowflake_token: Optional[str],
+    use_cache: bool,
+    params: Optional[Sequence[Any]]
+) -> List[Dict[str, Any]]:
+    """Dispatch a query to the configured connection method"""
     # Route to appropriate connection method
     if SNOWFLAKE_CONNECTION_METHOD.lower() == "connector":
         if not SNOWFLAKE_CONNECTOR_AVAILABLE:
             logger.error("Snowflake connector method requested but snowflake-connector-python is not available")
             return []
-        return await execute_snowflake_query_connector(sql, use_cache)
+        return await execute_snowflake_query_connector(sql, use_cache, params)
     else:
         # Default to API method
-        return await execute_snowflake_query_api(sql, snowflake_token, use_cache)
+        return await execute_snowflake_query_api(sql, snowflake_token, use_cache, params)
 
 
 async def execute_snowflake_query_api(
     sql: str,
     snowflake_token: Optional[str] = None,
-    use_cache: bool = True
+    use_cache: bool = True,
+    params: Optional[Sequence[Any]] = None
 ) -> List[Dict[str, Any]]:
     """Execute a SQL query against Snowflake API and return results with caching"""
     start_time = time.time()
@@ -473,11 +728,11 @@ async def execute_snowflake_query_api(
 
     # Check cache for SELECT queries
     cache_key = None
-    if use_cache and sql.strip().upper().startswith('SELECT'):
-        cache_key = get_cache_key("sql_query", sql=sql)
+    if use_cache and _is_select(sql):
+        cache_key = get_cache_key("sql_query", sql=sql, params=params)
         cached_result = get_from_cache(cache_key)
         if cached_result is not None:
-            logger.debug(f"Cache hit for SQL query: {sql[:50]}...")
+            logger.debug("Cache hit for SQL query: %.50s...", sql)
             track_snowflake_query(start_time, True)
             return cached_result
 
@@ -491,8 +746,10 @@ async def execute_snowflake_query_api(
             "schema": SNOWFLAKE_SCHEMA,
             "warehouse": SNOWFLAKE_WAREHOUSE,
         }
+        if params:
+            payload["bindings"] = build_query_bindings(params)
 
-        logger.info(f"Executing Snowflake query: {sql[:100]}...")  # Log first 100 chars of query
+        logger.info("Executing Snowflake query: %.100s...", sql)  # Log first 100 chars of query
 
         response = await make_snowflake_request(endpoint, "POST", payload, snowflake_token)
 
@@ -503,7 +760,7 @@ async def execute_snowflake_query_api(
 
         # Parse the response to extract data
         if response and "data" in response:
-            logger.info(f"Successfully got {len(response['data'])} rows from Snowflake")
+            logger.info("Successfully got %d rows from Snowflake", len(response['data']))
 
             all_data = response["data"]
 
@@ -512,51 +769,61 @@ async def execute_snowflake_query_api(
             partition_info = metadata.get('partitionInfo', [])
 
             if len(partition_info) > 1:
-                logger.info(f"Found {len(partition_info)} partitions, fetching remaining data...")
+                logger.info("Found %d partitions, fetching remaining data...", len(partition_info))
 
                 # Get the statement handle for pagination
                 statement_handle = response.get('statementHandle')
                 if statement_handle:
-                    # Fetch remaining partitions
-                    for partition_index in range(1, len(partition_info)):
-                        try:
-                            partition_endpoint = f"statements/{statement_handle}?partition={partition_index}"
-                            partition_response = await make_snowflake_request(
-                                partition_endpoint, "GET", None, snowflake_token
-                            )
-
-                            if partition_response and "data" in partition_response:
-                                partition_data = partition_response["data"]
-                                logger.info(f"Fetched partition {partition_index}: {len(partition_data)} rows")
-                                all_data.extend(partition_data)
-                            else:
-                                logger.warning(f"Failed to fetch partition {partition_index}")
-
-                        except Exception as e:
-                            logger.error(f"Error fetching partition {partition_index}: {e}")
-
-                logger.info(f"Total rows after fetching all partitions: {len(all_data)}")
+                    # Fetch remaining partitions concurrently, bounded like other query batches
+                    semaphore = asyncio.Semaphore(CONCURRENT_QUERY_BATCH_SIZE)
+
+                    async def fetch_partition(partition_index: int) -> Optional[List[Any]]:
+                        async with semaphore:
+                            try:
+                                partition_endpoint = f"statements/{statement_handle}?partition={partition_index}"
+                                partition_response = await make_snowflake_request(
+                                    partition_endpoint, "GET", None, snowflake_token
+                                )
+
+                                if partition_response and "data" in partition_response:
+                                    partition_data = partition_response["data"]
+                                    logger.info("Fetched partition %d: %d rows", partition_index, len(partition_data))
+                                    return partition_data
+                                logger.warning("Failed to fetch partition %d", partition_index)
+
+                            except Exception as e:
+                                logger.error("Error fetching partition %d: %s", partition_index, e)
+                            return None
+
+                    # gather preserves argument order, so rows stay in partition order
+                    partitions = await asyncio.gather(
+                        *(fetch_partition(partition_index) for partition_index in range(1, len(partition_info)))
+                    )
+                    # Build the combined result in one pass rather than growing it per partition
+                    all_data = list(chain(all_data, *(partition_data for partition_data in partitions if partition_data)))
+
+                logger.info("Total rows after fetching all partitions: %d", len(all_data))
 
             success = True
 
             # Cache successful SELECT results
             if use_cache and cache_key:
                 set_in_cache(cache_key, all_data)
-                logger.debug(f"Cached SQL result: {sql[:50]}...")
+                logger.debug("Cached SQL result: %.50s...", sql)
 
             return all_data
         elif response and "resultSet" in response:
             # Handle different response formats
             result_set = response["resultSet"]
             if "data" in result_set:
-                logger.info(f"Successfully got {len(result_set['data'])} rows from Snowflake (resultSet format)")
+                logger.info("Successfully got %d rows from Snowflake (resultSet format)", len(result_set['data']))
                 success = True
                 result_data = result_set["data"]
 
                 # Cache successful SELECT results
                 if use_cache and cache_key:
                     set_in_cache(cache_key, result_data)
-                    logger.debug(f"Cached SQL result: {sql[:50]}...")
+                    logger.debug("Cached SQL result: %.50s...", sql)
 
                 return result_data
 
@@ -565,8 +832,8 @@ async def execute_snowflake_query_api(
         return []
 
     except Exception as e:
-        logger.error(f"Error executing Snowflake query: {str(e)}")
-        logger.error(f"Query that failed: {sql}")
+        logger.error("Error executing Snowflake query: %s", e)
+        logger.error("Query that failed: %s", sql)
         return []
     finally:
         track_snowflake_query(start_time, success)
@@ -577,6 +844,12 @@ def parse_snowflake_timestamp(timestamp_str: str) -> str:
     if not timestamp_str or not isinstance(timestamp_str, str):
         return timestamp_str
 
+    return _parse_snowflake_timestamp_cached(timestamp_str)
+
+
+@lru_cache(maxsize=1 << 16)
+def _parse_snowflake_timestamp_cached(timestamp_str: str) -> str:
+    """Parse a non-empty timestamp string; repeated values across rows hit the cache"""
     try:
         # Handle format like "1753767533.658000000 1440"
         parts = timestamp_str.strip().split()
@@ -604,33 +877,34 @@ def parse_snowflake_timestamp(timestamp_str: str) -> str:
             return dt.strftime('%Y-%m-%dT%H:%M:%S')
 
     except (ValueError, TypeError) as e:
-        logger.debug(f"Could not parse timestamp '{timestamp_str}': {e}")
+        logger.debug("Could not parse timestamp '%s': %s", timestamp_str, e)
         return timestamp_str
 
 
-def format_snowflake_row(row_data: List[Any], columns: List[str]) -> Dict[str, Any]:
+def _timestamp_indices(columns: Sequence[str]) -> frozenset:
+    """Return the positions of the timestamp columns in a result set"""
+    return frozenset(i for i, column in enumerate(columns) if column.upper() in TIMESTAMP_COLUMNS)
+
+
+def format_snowflake_row(
+    row_data: List[Any],
+    columns: List[str],
+    ts_indices: Optional[frozenset] = None
+) -> Dict[str, Any]:
     """Convert Snowflake row data to dictionary using column names"""
     if len(row_data) != len(columns):
         return {}
 
-    result = {}
-    # Date/time columns that should be parsed
-    timestamp_columns = {
-        'CREATED', 'UPDATED', 'DUEDATE', 'RESOLUTIONDATE',
-        'ARCHIVEDDATE', '_FIVETRAN_SYNCED', 'CHANGE_TIMESTAMP'
-    }
-
-    for i in range(len(columns)):
-        column_name = columns[i].upper()
-        value = row_data[i]
-
-        # Parse timestamp columns
-        if column_name in timestamp_columns and value:
-            result[columns[i]] = parse_snowflake_timestamp(str(value))
-        else:
-            result[columns[i]] = value
+    if ts_indices is None:
+        ts_indices = _timestamp_indices(columns)
+    if not ts_indices:
+        return dict(zip(columns, row_data))
 
-    return result
+    # Parse timestamp columns
+    return {
+        columns[i]: parse_snowflake_timestamp(str(value)) if value and i in ts_indices else value
+        for i, value in enumerate(row_data)
+    }
 
 
 async def format_snowflake_rows_concurrent(
@@ -642,17 +916,12 @@ async def format_snowflake_rows_concurrent(
     if not rows:
         return []
 
-    logger.debug(f"Formatting {len(rows)} rows with batch size {batch_size}")
+    logger.debug("Formatting %d rows with batch size %d", len(rows), batch_size)
+    ts_indices = _timestamp_indices(columns)
 
-    # For small datasets, process directly
+    # For small datasets, format inline; an executor round-trip costs more than the work
     if len(rows) <= batch_size:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            _thread_pool,
-            _format_rows_batch,
-            rows,
-            columns
-        )
+        return _format_rows_batch(rows, columns, ts_indices)
 
     # For large datasets, process in batches
     all_formatted = []
@@ -661,7 +930,7 @@ async def format_snowflake_rows_concurrent(
     for i in range(0, len(rows), batch_size):
         batch = rows[i:i + batch_size]
         loop = asyncio.get_event_loop()
-        task = loop.run_in_executor(_thread_pool, _format_rows_batch, batch, columns)
+        task = loop.run_in_executor(_thread_pool, _format_rows_batch, batch, columns, ts_indices)
         tasks.append(task)
 
     # Execute all batches concurrently
@@ -670,23 +939,36 @@ async def format_snowflake_rows_concurrent(
 
         for result in batch_results:
             if isinstance(result, Exception):
-                logger.error(f"Error formatting batch: {result}")
+                logger.error("Error formatting batch: %s", result)
             else:
                 all_formatted.extend(result)
 
     except Exception as e:
-        logger.error(f"Error in concurrent row formatting: {e}")
+        logger.error("Error in concurrent row formatting: %s", e)
         # Fallback to sequential processing
         for row in rows:
-            all_formatted.append(format_snowflake_row(row, columns))
+            all_formatted.append(format_snowflake_row(row, columns, ts_indices))
 
-    logger.debug(f"Formatted {len(all_formatted)} rows")
+    logger.debug("Formatted %d rows", len(all_formatted))
     return all_formatted
 
 
-def _format_rows_batch(rows: List[List[Any]], columns: List[str]) -> List[Dict[str, Any]]:
+def _format_rows_batch(
+    rows: List[List[Any]],
+    columns: List[str],
+    ts_indices: Optional[frozenset] = None
+) -> List[Dict[str, Any]]:
     """Format a batch of rows in a thread (CPU-intensive operation)"""
-    return [format_snowflake_row(row, columns) for row in rows]
+    if ts_indices is None:
+        ts_indices = _timestamp_indices(columns)
+    return [format_snowflake_row(row, columns, ts_indices) for row in rows]
+
+
+def sanitize_issue_ids(issue_ids: List[Any]) -> List[str]:
+    """Return the numeric issue IDs as strings, de-duplicated in first-seen order"""
+    # Ensure issue IDs are numeric to prevent injection; dict.fromkeys drops repeats
+    candidates = (str(issue_id) for issue_id in issue_ids if isinstance(issue_id, (str, int)))
+    return list(dict.fromkeys(candidate for candidate in candidates if candidate.isdigit()))
 
 
 async def get_issue_labels(issue_ids: List[str], snowflake_token: Optional[str] = None, use_cache: bool = True) -> Dict[str, List[str]]:
@@ -694,66 +976,60 @@ async def get_issue_labels(issue_ids: List[str], snowflake_token: Optional[str]
     if not issue_ids:
         return {}
 
+    # Sanitize and validate issue IDs (should be numeric)
+    sanitized_ids = sanitize_issue_ids(issue_ids)
+    if not sanitized_ids:
+        return {}
+
+    return await _fetch_issue_labels(sanitized_ids, snowflake_token, use_cache)
+
+
+async def _fetch_issue_labels(sanitized_ids: List[str], snowflake_token: Optional[str], use_cache: bool) -> Dict[str, List[str]]:
+    """Fetch labels for IDs that have already been through sanitize_issue_ids"""
     # Check cache first
-    cache_key = get_cache_key("labels", issue_ids=",".join(sorted(issue_ids)))
+    cache_key = ("labels", frozenset(sanitized_ids))
     if use_cache:
         cached_result = get_from_cache(cache_key)
         if cached_result is not None:
-            logger.debug(f"Cache hit for labels: {len(issue_ids)} issues")
+            logger.debug("Cache hit for labels: %d issues", len(sanitized_ids))
             return cached_result
 
-    labels_data = {}
+    labels_data: Dict[str, List[str]] = defaultdict(list)
 
     try:
-        # Sanitize and validate issue IDs (should be numeric)
-        sanitized_ids = []
-        for issue_id in issue_ids:
-            # Ensure issue IDs are numeric to prevent injection
-            if isinstance(issue_id, (str, int)) and str(issue_id).isdigit():
-                sanitized_ids.append(str(issue_id))
-
-        if not sanitized_ids:
-            return {}
-
-        # Create comma-separated list for IN clause
-        ids_str = "'" + "','".join(sanitized_ids) + "'"
-
-        sql = f"""
-        SELECT ISSUE, LABEL
-        FROM {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_LABEL_RHAI
-        WHERE ISSUE IN ({ids_str}) AND LABEL IS NOT NULL
-        """
+        # Bind the IDs as one JSON array so the statement text is the same for every ID set
+        ids_json = json.dumps(sanitized_ids)
 
         if SNOWFLAKE_CONNECTION_METHOD.lower() == "connector":
-            rows = await execute_snowflake_query(sql, None, use_cache)
+            rows = await execute_snowflake_query(LABELS_SQL, None, use_cache, params=[ids_json])
             # Connector method returns dictionaries already
             for row in rows:
                 issue_id = str(row.get("ISSUE"))
                 label = row.get("LABEL")
                 if issue_id and label:
-                    if issue_id not in labels_data:
-                        labels_data[issue_id] = []
                     labels_data[issue_id].append(label)
         else:
-            rows = await execute_snowflake_query(sql, snowflake_token, use_cache)
-            columns = ["ISSUE", "LABEL"]
+            rows = await execute_snowflake_query(LABELS_SQL, snowflake_token, use_cache, params=[ids_json])
+            # Only ISSUE and LABEL are selected, so unpack them without building a row dict
             for row in rows:
-                row_dict = format_snowflake_row(row, columns)
-                issue_id = str(row_dict.get("ISSUE"))
-                label = row_dict.get("LABEL")
+                if len(row) != 2:
+                    continue
+                issue_id = str(row[0])
+                label = row[1]
 
                 if issue_id and label:
-                    if issue_id not in labels_data:
-                        labels_data[issue_id] = []
                     labels_data[issue_id].append(label)
 
+        # Hand back a plain dict so lookups of unknown issues don't insert keys
+        labels_data = dict(labels_data)
+
         # Cache the result
         if use_cache:
             set_in_cache(cache_key, labels_data)
-            logger.debug(f"Cached labels for {len(issue_ids)} issues")
+            logger.debug("Cached labels for %d issues", len(sanitized_ids))
 
     except Exception as e:
-        logger.error(f"Error fetching labels: {str(e)}")
+        logger.error("Error fetching labels: %s", e)
 
     return labels_data
 
@@ -763,45 +1039,36 @@ async def get_issue_comments(issue_ids: List[str], snowflake_token: Optional[str
     if not issue_ids:
         return {}
 
+    # Sanitize and validate issue IDs (should be numeric)
+    sanitized_ids = sanitize_issue_ids(issue_ids)
+    if not sanitized_ids:
+        return {}
+
+    return await _fetch_issue_comments(sanitized_ids, snowflake_token, use_cache)
+
+
+async def _fetch_issue_comments(sanitized_ids: List[str], snowflake_token: Optional[str], use_cache: bool) -> Dict[str, List[Dict[str, Any]]]:
+    """Fetch comments for IDs that have already been through sanitize_issue_ids"""
     # Check cache first
-    cache_key = get_cache_key("comments", issue_ids=",".join(sorted(issue_ids)))
+    cache_key = ("comments", frozenset(sanitized_ids))
     if use_cache:
         cached_result = get_from_cache(cache_key)
         if cached_result is not None:
-            logger.debug(f"Cache hit for comments: {len(issue_ids)} issues")
+            logger.debug("Cache hit for comments: %d issues", len(sanitized_ids))
             return cached_result
 
-    comments_data = {}
+    comments_data: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
 
     try:
-        # Sanitize and validate issue IDs (should be numeric)
-        sanitized_ids = []
-        for issue_id in issue_ids:
-            # Ensure issue IDs are numeric to prevent injection
-            if isinstance(issue_id, (str, int)) and str(issue_id).isdigit():
-                sanitized_ids.append(str(issue_id))
-
-        if not sanitized_ids:
-            return {}
-
-        # Create comma-separated list for IN clause
-        ids_str = "'" + "','".join(sanitized_ids) + "'"
-
-        sql = f"""
-        SELECT ID, ISSUEID, ROLELEVEL, BODY, CREATED, UPDATED
-        FROM {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_COMMENT_NON_PII
-        WHERE ISSUEID IN ({ids_str}) AND BODY IS NOT NULL
-        ORDER BY ISSUEID, CREATED ASC
-        """
+        # Bind the IDs as one JSON array so the statement text is the same for every ID set
+        ids_json = json.dumps(sanitized_ids)
 
         if SNOWFLAKE_CONNECTION_METHOD.lower() == "connector":
-            rows = await execute_snowflake_query(sql, None, use_cache)
+            rows = await execute_snowflake_query(COMMENTS_SQL, None, use_cache, params=[ids_json])
             # Connector method returns dictionaries already
             for row in rows:
                 issue_id = str(row.get("ISSUEID"))
                 if issue_id:
-                    if issue_id not in comments_data:
-                        comments_data[issue_id] = []
                     comment = {
                         "id": row.get("ID"),
                         "role_level": row.get("ROLELEVEL"),
@@ -811,80 +1078,96 @@ async def get_issue_comments(issue_ids: List[str], snowflake_token: Optional[str
                     }
                     comments_data[issue_id].append(comment)
         else:
-            rows = await execute_snowflake_query(sql, snowflake_token, use_cache)
-            columns = ["ID", "ISSUEID", "ROLELEVEL", "BODY", "CREATED", "UPDATED"]
+            rows = await execute_snowflake_query(COMMENTS_SQL, snowflake_token, use_cache, params=[ids_json])
+            # Unpack the selected columns in order; only CREATED and UPDATED need timestamp parsing
             for row in rows:
-                row_dict = format_snowflake_row(row, columns)
-                issue_id = str(row_dict.get("ISSUEID"))
+                if len(row) != 6:
+                    continue
+                comment_id, issue_id, role_level, body, created, updated = row
+                issue_id = str(issue_id)
 
                 if issue_id:
-                    if issue_id not in comments_data:
-                        comments_data[issue_id] = []
-
                     comment = {
-                        "id": row_dict.get("ID"),
-                        "role_level": row_dict.get("ROLELEVEL"),
-                        "body": row_dict.get("BODY"),
-                        "created": row_dict.get("CREATED"),
-                        "updated": row_dict.get("UPDATED")
+                        "id": comment_id,
+                        "role_level": role_level,
+                        "body": body,
+                        "created": parse_snowflake_timestamp(str(created)) if created else created,
+                        "updated": parse_snowflake_timestamp(str(updated)) if updated else updated
                     }
                     comments_data[issue_id].append(comment)
 
+        comments_data = dict(comments_data)
+
         # Cache the result
         if use_cache:
             set_in_cache(cache_key, comments_data)
-            logger.debug(f"Cached comments for {len(issue_ids)} issues")
+            logger.debug("Cached comments for %d issues", len(sanitized_ids))
 
     except Exception as e:
-        logger.error(f"Error fetching comments: {str(e)}")
+        logger.error("Error fetching comments: %s", e)
 
     return comments_data
 
 
-def _process_links_rows(rows: List[Dict[str, Any]], sanitized_ids: List[str], links_data: Dict[str, List[Dict[str, Any]]], use_dict_rows: bool = True) -> None:
-    """Helper function to process link rows for both connector and API methods"""
-    for row_dict in rows:
-        source_id = str(row_dict.get("SOURCE"))
-        destination_id = str(row_dict.get("DESTINATION"))
-
-        # Create link object
-        link = {
-            "link_id": row_dict.get("LINK_ID"),
-            "source_id": source_id,
-            "destination_id": destination_id,
-            "sequence": row_dict.get("SEQUENCE"),
-            "link_type": row_dict.get("LINKNAME"),
-            "inward_description": row_dict.get("INWARD"),
-            "outward_description": row_dict.get("OUTWARD"),
-            "source_key": row_dict.get("SOURCE_KEY"),
-            "destination_key": row_dict.get("DESTINATION_KEY"),
-            "source_summary": row_dict.get("SOURCE_SUMMARY"),
-            "destination_summary": row_dict.get("DESTINATION_SUMMARY")
-        }
-
-        # Add to both source and destination issue data
-        for issue_id in [source_id, destination_id]:
-            if issue_id in sanitized_ids:
-                if issue_id not in links_data:
-                    links_data[issue_id] = []
-
-                # Determine relationship direction for this issue
-                if issue_id == source_id:
-                    link_copy = link.copy()
-                    link_copy["relationship"] = "outward"
-                    link_copy["related_issue_id"] = destination_id
-                    link_copy["related_issue_key"] = row_dict.get("DESTINATION_KEY")
-                    link_copy["related_issue_summary"] = row_dict.get("DESTINATION_SUMMARY")
-                    link_copy["relationship_description"] = row_dict.get("OUTWARD")
-                else:
-                    link_copy = link.copy()
-                    link_copy["relationship"] = "inward"
-                    link_copy["related_issue_id"] = source_id
-                    link_copy["related_issue_key"] = row_dict.get("SOURCE_KEY")
-                    link_copy["related_issue_summary"] = row_dict.get("SOURCE_SUMMARY")
-                    link_copy["relationship_description"] = row_dict.get("INWARD")
+def _process_links_rows(rows: List[Any], sanitized_ids: List[str], links_data: DefaultDict[str, List[Dict[str, Any]]], use_dict_rows: bool = True) -> None:
+    """Helper function to process link rows for both connector and API methods
 
-                links_data[issue_id].append(link_copy)
+    Connector rows are dicts keyed by LINK_COLUMNS; API rows are lists in that
+    same column order and are unpacked positionally.
+    """
+    # Each row checks both endpoints, so look them up in a set rather than the list
+    wanted_ids = set(sanitized_ids)
+    for row in rows:
+        if use_dict_rows:
+            fields = _get_link_fields(row)
+        elif len(row) == len(LINK_COLUMNS):
+            fields = row
+        else:
+            continue
+        (link_id, source, destination, sequence, link_name, inward, outward,
+         source_key, destination_key, source_summary, destination_summary) = fields
+        source_id = str(source)
+        destination_id = str(destination)
+
+        # Build each side's link dict in one literal rather than copying a shared base dict
+        if source_id in wanted_ids:
+            links_data[source_id].append({
+                "link_id": link_id,
+                "source_id": source_id,
+                "destination_id": destination_id,
+                "sequence": sequence,
+                "link_type": link_name,
+                "inward_description": inward,
+                "outward_description": outward,
+                "source_key": source_key,
+                "destination_key": destination_key,
+                "source_summary": source_summary,
+                "destination_summary": destination_summary,
+                "relationship": "outward",
+                "related_issue_id": destination_id,
+                "related_issue_key": destination_key,
+                "related_issue_summary": destination_summary,
+                "relationship_description": outward
+            })
+        if destination_id in wanted_ids:
+            links_data[destination_id].append({
+                "link_id": link_id,
+                "source_id": source_id,
+                "destination_id": destination_id,
+                "sequence": sequence,
+                "link_type": link_name,
+                "inward_description": inward,
+                "outward_description": outward,
+                "source_key": source_key,
+                "destination_key": destination_key,
+                "source_summary": source_summary,
+                "destination_summary": destination_summary,
+                "relationship": "inward",
+                "related_issue_id": source_id,
+                "related_issue_key": source_key,
+                "related_issue_summary": source_summary,
+                "relationship_description": inward
+            })
 
 
 async def get_issue_links(issue_ids: List[str], snowflake_token: Optional[str] = None, use_cache: bool = True) -> Dict[str, List[Dict[str, Any]]]:
@@ -892,78 +1175,48 @@ async def get_issue_links(issue_ids: List[str], snowflake_token: Optional[str] =
     if not issue_ids:
         return {}
 
+    # Sanitize and validate issue IDs (should be numeric)
+    sanitized_ids = sanitize_issue_ids(issue_ids)
+    if not sanitized_ids:
+        return {}
+
+    return await _fetch_issue_links(sanitized_ids, snowflake_token, use_cache)
+
+
+async def _fetch_issue_links(sanitized_ids: List[str], snowflake_token: Optional[str], use_cache: bool) -> Dict[str, List[Dict[str, Any]]]:
+    """Fetch links for IDs that have already been through sanitize_issue_ids"""
     # Check cache first
-    cache_key = get_cache_key("links", issue_ids=",".join(sorted(issue_ids)))
+    cache_key = ("links", frozenset(sanitized_ids))
     if use_cache:
         cached_result = get_from_cache(cache_key)
         if cached_result is not None:
-            logger.debug(f"Cache hit for links: {len(issue_ids)} issues")
+            logger.debug("Cache hit for links: %d issues", len(sanitized_ids))
             return cached_result
 
-    links_data = {}
+    links_data: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(list)
 
     try:
-        # Sanitize and validate issue IDs (should be numeric)
-        sanitized_ids = []
-        for issue_id in issue_ids:
-            # Ensure issue IDs are numeric to prevent injection
-            if isinstance(issue_id, (str, int)) and str(issue_id).isdigit():
-                sanitized_ids.append(str(issue_id))
-
-        if not sanitized_ids:
-            return {}
-
-        # Create comma-separated list for IN clause
-        ids_str = "'" + "','".join(sanitized_ids) + "'"
-
-        sql = f"""
-        SELECT
-            il.ID as LINK_ID,
-            il.SOURCE,
-            il.DESTINATION,
-            il.SEQUENCE,
-            ilt.LINKNAME,
-            ilt.INWARD,
-            ilt.OUTWARD,
-            si.ISSUE_KEY as SOURCE_KEY,
-            di.ISSUE_KEY as DESTINATION_KEY,
-            si.SUMMARY as SOURCE_SUMMARY,
-            di.SUMMARY as DESTINATION_SUMMARY
-        FROM {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_ISSUELINK_RHAI il
-        JOIN {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_ISSUELINKTYPE_RHAI ilt
-            ON il.LINKTYPE = ilt.ID
-        LEFT JOIN {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_ISSUE_NON_PII si
-            ON il.SOURCE = si.ID
-        LEFT JOIN {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_ISSUE_NON_PII di
-            ON il.DESTINATION = di.ID
-        WHERE (il.SOURCE IN ({ids_str}) OR il.DESTINATION IN ({ids_str}))
-        ORDER BY il.SOURCE, il.SEQUENCE
-        """
+        # Bind the IDs as one JSON array so the statement text is the same for every ID set
+        ids_json = json.dumps(sanitized_ids)
 
         if SNOWFLAKE_CONNECTION_METHOD.lower() == "connector":
-            rows = await execute_snowflake_query(sql, None, use_cache)
+            rows = await execute_snowflake_query(LINKS_SQL, None, use_cache, params=[ids_json, ids_json])
             # Connector method returns dictionaries already
             _process_links_rows(rows, sanitized_ids, links_data, use_dict_rows=True)
         else:
-            rows = await execute_snowflake_query(sql, snowflake_token, use_cache)
-            columns = [
-                "LINK_ID", "SOURCE", "DESTINATION", "SEQUENCE", "LINKNAME",
-                "INWARD", "OUTWARD", "SOURCE_KEY", "DESTINATION_KEY",
-                "SOURCE_SUMMARY", "DESTINATION_SUMMARY"
-            ]
-            # API method returns list of lists, need to format
-            formatted_rows = []
-            for row in rows:
-                formatted_rows.append(format_snowflake_row(row, columns))
-            _process_links_rows(formatted_rows, sanitized_ids, links_data, use_dict_rows=True)
+            rows = await execute_snowflake_query(LINKS_SQL, snowflake_token, use_cache, params=[ids_json, ids_json])
+            # API method returns list of lists in LINK_COLUMNS order; none are timestamps
+            _process_links_rows(rows, sanitized_ids, links_data, use_dict_rows=False)
+
+        links_data = dict(links_data)
 
         # Cache the result
         if use_cache:
             set_in_cache(cache_key, links_data)
-            logger.debug(f"Cached links for {len(issue_ids)} issues")
+            logger.debug("Cached links for %d issues", len(sanitized_ids))
 
     except Exception as e:
-        logger.error(f"Error fetching issue links: {str(e)}")
+        logger.error("Error fetching issue links: %s", e)
 
     return links_data
 
@@ -973,55 +1226,36 @@ async def get_issue_status_changes(issue_ids: List[str], snowflake_token: Option
     if not issue_ids:
         return {}
 
+    # Sanitize and validate issue IDs (should be numeric)
+    sanitized_ids = sanitize_issue_ids(issue_ids)
+    if not sanitized_ids:
+        return {}
+
+    return await _fetch_issue_status_changes(sanitized_ids, snowflake_token, use_cache)
+
+
+async def _fetch_issue_status_changes(sanitized_ids: List[str], snowflake_token: Optional[str], use_cache: bool) -> Dict[str, List[Dict[str, Any]]]:
+    """Fetch status changes for IDs that have already been through sanitize_issue_ids"""
     # Check cache first
-    cache_key = get_cache_key("status_changes", issue_ids=",".join(sorted(issue_ids)))
+    cache_key = ("status_changes", frozenset(sanitized_ids))
     if use_cache:
         cached_result = get_from_cache(cache_key)
         if cached_result is not None:
-            logger.debug(f"Cache hit for status changes: {len(issue_ids)} issues")
+            logger.debug("Cache hit for status changes: %d issues", len(sanitized_ids))
             return cached_result
 
-    status_changes_data = {}
+    status_changes_data: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
 
     try:
-        # Sanitize and validate issue IDs (should be numeric)
-        sanitized_ids = []
-        for issue_id in issue_ids:
-            # Ensure issue IDs are numeric to prevent injection
-            if isinstance(issue_id, (str, int)) and str(issue_id).isdigit():
-                sanitized_ids.append(str(issue_id))
-
-        if not sanitized_ids:
-            return {}
-
-        # Create comma-separated list for IN clause
-        ids_str = "'" + "','".join(sanitized_ids) + "'"
-
-        sql = f"""
-        SELECT
-            ji.issue_key,
-            cg.created as change_timestamp,
-            old_status.pname as from_status,
-            new_status.pname as to_status,
-            CONCAT(old_status.pname, ' → ', new_status.pname) as status_transition
-        FROM {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_CHANGEGROUP_RHAI cg
-        JOIN {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_CHANGEITEM_NON_PII ci ON cg.id = ci.groupid
-        JOIN {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_ISSUE_NON_PII ji ON cg.issueid = ji.id
-        LEFT JOIN {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_ISSUESTATUS_RHAI old_status ON ci.oldvalue = old_status.id
-        LEFT JOIN {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_ISSUESTATUS_RHAI new_status ON ci.newvalue = new_status.id
-        WHERE ci.field = 'status'
-          AND ji.id IN ({ids_str})
-        ORDER BY ji.issue_key, cg.created ASC
-        """
+        # Bind the IDs as one JSON array so the statement text is the same for every ID set
+        ids_json = json.dumps(sanitized_ids)
 
         if SNOWFLAKE_CONNECTION_METHOD.lower() == "connector":
-            rows = await execute_snowflake_query(sql, None, use_cache)
+            rows = await execute_snowflake_query(STATUS_CHANGES_SQL, None, use_cache, params=[ids_json])
             # Connector method returns dictionaries already
             for row in rows:
                 issue_key = row.get("ISSUE_KEY")
                 if issue_key:
-                    if issue_key not in status_changes_data:
-                        status_changes_data[issue_key] = []
                     status_change = {
                         "issue_key": issue_key,
                         "change_timestamp": row.get("CHANGE_TIMESTAMP"),
@@ -1031,32 +1265,31 @@ async def get_issue_status_changes(issue_ids: List[str], snowflake_token: Option
                     }
                     status_changes_data[issue_key].append(status_change)
         else:
-            rows = await execute_snowflake_query(sql, snowflake_token, use_cache)
-            columns = ["ISSUE_KEY", "CHANGE_TIMESTAMP", "FROM_STATUS", "TO_STATUS", "STATUS_TRANSITION"]
+            rows = await execute_snowflake_query(STATUS_CHANGES_SQL, snowflake_token, use_cache, params=[ids_json])
             for row in rows:
-                row_dict = format_snowflake_row(row, columns)
-                issue_key = row_dict.get("ISSUE_KEY")
+                if len(row) != 5:
+                    continue
+                issue_key, change_timestamp, from_status, to_status, status_transition = row
 
                 if issue_key:
-                    if issue_key not in status_changes_data:
-                        status_changes_data[issue_key] = []
-
                     status_change = {
                         "issue_key": issue_key,
-                        "change_timestamp": row_dict.get("CHANGE_TIMESTAMP"),
-                        "from_status": row_dict.get("FROM_STATUS"),
-                        "to_status": row_dict.get("TO_STATUS"),
-                        "status_transition": row_dict.get("STATUS_TRANSITION")
+                        "change_timestamp": parse_snowflake_timestamp(str(change_timestamp)) if change_timestamp else change_timestamp,
+                        "from_status": from_status,
+                        "to_status": to_status,
+                        "status_transition": status_transition
                     }
                     status_changes_data[issue_key].append(status_change)
 
+        status_changes_data = dict(status_changes_data)
+
         # Cache the result
         if use_cache:
             set_in_cache(cache_key, status_changes_data)
-            logger.debug(f"Cached status changes for {len(issue_ids)} issues")
+            logger.debug("Cached status changes for %d issues", len(sanitized_ids))
 
     except Exception as e:
-        logger.error(f"Error fetching status changes: {str(e)}")
+        logger.error("Error fetching status changes: %s", e)
 
     return status_changes_data
 
@@ -1070,14 +1303,19 @@ async def get_issue_enrichment_data_concurrent(
     if not issue_ids:
         return {}, {}, {}, {}
 
-    logger.info(f"Fetching enrichment data for {len(issue_ids)} issues concurrently")
+    # Validate the IDs once here and hand the clean list straight to the fetch helpers
+    sanitized_ids = sanitize_issue_ids(issue_ids)
+    if not sanitized_ids:
+        return {}, {}, {}, {}
+
+    logger.info("Fetching enrichment data for %d issues concurrently", len(sanitized_ids))
 
     # Use asyncio.gather to run all four operations concurrently
     try:
-        labels_task = get_issue_labels(issue_ids, snowflake_token, use_cache)
-        comments_task = get_issue_comments(issue_ids, snowflake_token, use_cache)
-        links_task = get_issue_links(issue_ids, snowflake_token, use_cache)
-        status_changes_task = get_issue_status_changes(issue_ids, snowflake_token, use_cache)
+        labels_task = _fetch_issue_labels(sanitized_ids, snowflake_token, use_cache)
+        comments_task = _fetch_issue_comments(sanitized_ids, snowflake_token, use_cache)
+        links_task = _fetch_issue_links(sanitized_ids, snowflake_token, use_cache)
+        status_changes_task = _fetch_issue_status_changes(sanitized_ids, snowflake_token, use_cache)
 
         labels_data, comments_data, links_data, status_changes_data = await asyncio.gather(
             labels_task, comments_task, links_task, status_changes_task, return_exceptions=True
@@ -1085,23 +1323,23 @@ async def get_issue_enrichment_data_concurrent(
 
         # Handle exceptions
         if isinstance(labels_data, Exception):
-            logger.error(f"Error fetching labels: {labels_data}")
+            logger.error("Error fetching labels: %s", labels_data)
             labels_data = {}
         if isinstance(comments_data, Exception):
-            logger.error(f"Error fetching comments: {comments_data}")
+            logger.error("Error fetching comments: %s", comments_data)
             comments_data = {}
         if isinstance(links_data, Exception):
-            logger.error(f"Error fetching links: {links_data}")
+            logger.error("Error fetching links: %s", links_data)
             links_data = {}
         if isinstance(status_changes_data, Exception):
-            logger.error(f"Error fetching status changes: {status_changes_data}")
+            logger.error("Error fetching status changes: %s", status_changes_data)
             status_changes_data = {}
 
-        logger.info(f"Successfully fetched enrichment data for {len(issue_ids)} issues")
+        logger.info("Successfully fetched enrichment data for %d issues", len(sanitized_ids))
         return labels_data, comments_data, links_data, status_changes_data
 
     except Exception as e:
-        logger.error(f"Error in concurrent enrichment data fetch: {e}")
+        logger.error("Error in concurrent enrichment data fetch: %s", e)
         return {}, {}, {}, {}
 
 
@@ -1115,14 +1353,14 @@ async def execute_queries_in_batches(
     if not queries:
         return []
 
-    logger.info(f"Executing {len(queries)} queries in batches of {batch_size}")
+    logger.info("Executing %d queries in batches of %d", len(queries), batch_size)
 
     all_results = []
 
     # Process queries in batches
     for i in range(0, len(queries), batch_size):
         batch = queries[i:i + batch_size]
-        logger.debug(f"Processing batch {i // batch_size + 1}: {len(batch)} queries")
+        logger.debug("Processing batch %d: %d queries", i // batch_size + 1, len(batch))
 
         # Execute batch concurrently
         tasks = [execute_snowflake_query(sql, snowflake_token, use_cache) for sql in batch]
@@ -1133,15 +1371,15 @@ async def execute_queries_in_batches(
             # Handle exceptions and collect results
             for j, result in enumerate(batch_results):
                 if isinstance(result, Exception):
-                    logger.error(f"Query {i + j} failed: {result}")
+                    logger.error("Query %d failed: %s", i + j, result)
                     all_results.append([])
                 else:
                     all_results.append(result)
 
         except Exception as e:
-            logger.error(f"Error in batch {i // batch_size + 1}: {e}")
+            logger.error("Error in batch %d: %s", i // batch_size + 1, e)
             # Add empty results for failed batch
             all_results.extend([[]] * len(batch))
 
-    logger.info(f"Completed {len(queries)} queries in batches")
+    logger.info("Completed %d queries in batches", len(queries))
     return all_results
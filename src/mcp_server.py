@@ -6,8 +6,12 @@ A Model Context Protocol (MCP) server that provides access to JIRA data stored i
 Includes optional Prometheus metrics for monitoring tool usage and performance.
 """
 
+import sys
+import asyncio
 import logging
+from typing import Callable, Optional
 
+import anyio
 from mcp.server.fastmcp import FastMCP
 
 from config import MCP_TRANSPORT, FASTMCP_HOST, FASTMCP_PORT
@@ -24,7 +28,46 @@ async def async_cleanup():
     try:
         await cleanup_resources()
     except Exception as e:
-        logger.error(f"Error during cleanup: {e}")
+        logger.error("Error during cleanup: %s", e)
+
+
+# Coroutine methods FastMCP.run() dispatches to for the network transports
+NETWORK_TRANSPORT_RUNNERS = {
+    "sse": "run_sse_async",
+    "streamable-http": "run_streamable_http_async",
+}
+
+
+def get_fast_loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Return uvloop's event loop factory for the network transports when it is installed"""
+    if MCP_TRANSPORT not in NETWORK_TRANSPORT_RUNNERS or sys.platform == "win32":
+        return None
+
+    try:
+        import uvloop
+    except ImportError:
+        return None
+
+    logger.info("Using uvloop event loop for %s transport", MCP_TRANSPORT)
+    return uvloop.new_event_loop
+
+
+def run_server(mcp: FastMCP, mount_path: Optional[str] = None) -> None:
+    """Run the configured transport, on uvloop when it is available"""
+    loop_factory = get_fast_loop_factory()
+    if loop_factory is None:
+        mcp.run(transport=MCP_TRANSPORT, mount_path=mount_path)
+        return
+
+    # FastMCP.run() calls anyio.run() without backend options, so start the
+    # transport coroutine ourselves; this avoids the deprecated loop policy API.
+    # Like FastMCP.run(), only the sse runner takes the mount path.
+    runner_args = (mount_path,) if MCP_TRANSPORT == "sse" else ()
+    anyio.run(
+        getattr(mcp, NETWORK_TRANSPORT_RUNNERS[MCP_TRANSPORT]),
+        *runner_args,
+        backend_options={"loop_factory": loop_factory},
+    )
 
 
 def main():
@@ -45,20 +88,19 @@ def main():
     # Run the MCP server
     try:
         logger.info("Starting JIRA MCP Server for Snowflake")
-        mcp.run(transport=MCP_TRANSPORT)
+        run_server(mcp)
     except KeyboardInterrupt:
         logger.info("Shutting down MCP server...")
     except Exception as e:
-        logger.error(f"Error running MCP server: {e}")
+        logger.error("Error running MCP server: %s", e)
         raise
     finally:
         # Clean up resources
         set_active_connections(0)
-        import asyncio
         try:
             asyncio.run(async_cleanup())
         except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
         logger.info("MCP server shutdown complete")
 
 
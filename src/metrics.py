@@ -10,6 +10,14 @@ from config import ENABLE_METRICS, METRICS_PORT, PROMETHEUS_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+# The metrics server runs in a daemon thread and is never shut down explicitly,
+# so the serve_forever() poll interval only controls idle wakeups, not latency.
+METRICS_SERVER_POLL_INTERVAL_SECONDS = 3600.0
+
+# The health check response never changes, so build it once
+HEALTH_RESPONSE_BODY = b'{"status": "healthy"}'
+HEALTH_CONTENT_LENGTH = str(len(HEALTH_RESPONSE_BODY))
+
 # Initialize Prometheus metrics if enabled
 if ENABLE_METRICS and PROMETHEUS_AVAILABLE:
     from prometheus_client import Counter, Histogram, Gauge, CONTENT_TYPE_LATEST, generate_latest
@@ -65,7 +73,7 @@ if ENABLE_METRICS and PROMETHEUS_AVAILABLE:
         'Number of active HTTP connections in the pool'
     )
 
-    logger.info(f"Prometheus metrics enabled on port {METRICS_PORT}")
+    logger.info("Prometheus metrics enabled on port %d", METRICS_PORT)
 elif ENABLE_METRICS and not PROMETHEUS_AVAILABLE:
     logger.warning("Metrics enabled but prometheus_client not available. Install with: pip install prometheus_client")
 else:
@@ -153,14 +161,15 @@ class MetricsHandler(http.server.BaseHTTPRequestHandler):
                 self.end_headers()
                 self.wfile.write(metrics_data)
             except Exception as e:
-                logger.error(f"Error generating metrics: {e}")
+                logger.error("Error generating metrics: %s", e)
                 self.send_error(500, f"Internal Server Error: {e}")
         elif self.path == '/health':
             # Health check endpoint
             self.send_response(200)
             self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', HEALTH_CONTENT_LENGTH)
             self.end_headers()
-            self.wfile.write(b'{"status": "healthy"}')
+            self.wfile.write(HEALTH_RESPONSE_BODY)
         else:
             self.send_error(404, "Not Found")
 
@@ -177,12 +186,12 @@ def start_metrics_server() -> None:
     try:
         httpd = socketserver.TCPServer(("", METRICS_PORT), MetricsHandler)
         httpd.allow_reuse_address = True
-        logger.info(f"Metrics server started on port {METRICS_PORT}")
-        logger.info(f"Metrics available at http://localhost:{METRICS_PORT}/metrics")
-        logger.info(f"Health check available at http://localhost:{METRICS_PORT}/health")
-        httpd.serve_forever()
+        logger.info("Metrics server started on port %d", METRICS_PORT)
+        logger.info("Metrics available at http://localhost:%d/metrics", METRICS_PORT)
+        logger.info("Health check available at http://localhost:%d/health", METRICS_PORT)
+        httpd.serve_forever(poll_interval=METRICS_SERVER_POLL_INTERVAL_SECONDS)
     except Exception as e:
-        logger.error(f"Failed to start metrics server: {e}")
+        logger.error("Failed to start metrics server: %s", e)
 
 
 def start_metrics_thread() -> None:
@@ -1,13 +1,15 @@
+import json
 import logging
+from collections import Counter, defaultdict
 from typing import Any, Optional, Dict, List
 
 from mcp.server.fastmcp import FastMCP
 
 from config import MCP_TRANSPORT, SNOWFLAKE_TOKEN, INTERNAL_GATEWAY, SNOWFLAKE_CONNECTION_METHOD, SNOWFLAKE_DATABASE, SNOWFLAKE_SCHEMA
 from database import (
+    _timestamp_indices,
     execute_snowflake_query,
     format_snowflake_row,
-    sanitize_sql_value,
     get_issue_links,
     get_issue_enrichment_data_concurrent
 )
@@ -36,10 +38,23 @@ def get_snowflake_token(mcp: FastMCP) -> Optional[str]:
         except KeyError:
             logger.error("X-Snowflake-Token header not found in request headers")
         except Exception as e:
-            logger.error(f"Error getting token from request context: {e}")
+            logger.error("Error getting token from request context: %s", e)
         return None
 
 
+def parse_label_array(value: Any) -> List[str]:
+    """Decode an ARRAY_AGG label column, which Snowflake returns as a JSON array string"""
+    if not value:
+        return []
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            logger.warning("Could not decode label array: %.50s", value)
+            return []
+    return [label for label in value if label] if isinstance(value, list) else []
+
+
 def register_tools(mcp: FastMCP) -> None:
     """Register all MCP tools"""
 
@@ -88,48 +103,58 @@ def register_tools(mcp: FastMCP) -> None:
             if not snowflake_token and SNOWFLAKE_CONNECTION_METHOD == "api":
                 return {"error": "Snowflake token not available", "issues": []}
 
-            # Build SQL query with filters - always include component joins
+            # Build SQL query with filters - always include component joins.
+            # User-supplied values are bound as '?' parameters, in placeholder order.
             sql_conditions = []
+            params: List[Any] = []
 
             if issue_keys:
-                sql_conditions.append(f"i.ISSUE_KEY IN ({', '.join([f"'{sanitize_sql_value(key)}'" for key in issue_keys])})")
+                sql_conditions.append(f"i.ISSUE_KEY IN ({', '.join('?' for _ in issue_keys)})")
+                params.extend(issue_keys)
 
             if project:
-                sql_conditions.append(f"i.PROJECT = '{sanitize_sql_value(project.upper())}'")
+                sql_conditions.append("i.PROJECT = ?")
+                params.append(project.upper())
 
             if issue_type:
-                sql_conditions.append(f"i.ISSUETYPE = '{sanitize_sql_value(issue_type)}'")
+                sql_conditions.append("i.ISSUETYPE = ?")
+                params.append(issue_type)
 
             if status:
-                sql_conditions.append(f"i.ISSUESTATUS = '{sanitize_sql_value(status)}'")
+                sql_conditions.append("i.ISSUESTATUS = ?")
+                params.append(status)
 
             if priority:
-                sql_conditions.append(f"i.PRIORITY = '{sanitize_sql_value(priority)}'")
+                sql_conditions.append("i.PRIORITY = ?")
+                params.append(priority)
 
             if search_text:
-                search_condition = f"(LOWER(i.SUMMARY) LIKE '%{sanitize_sql_value(search_text.lower())}%' OR LOWER(i.DESCRIPTION) LIKE '%{sanitize_sql_value(search_text.lower())}%')"
-                sql_conditions.append(search_condition)
+                # ILIKE matches case-insensitively without lowercasing every row
+                search_pattern = f"%{search_text}%"
+                sql_conditions.append("(i.SUMMARY ILIKE ? OR i.DESCRIPTION ILIKE ?)")
+                params.extend([search_pattern, search_pattern])
 
             if components:
                 # Support comma-separated component filters (match ANY)
                 component_terms = [
-                    term.strip().lower() for term in components.split(",") if term.strip()
+                    term.strip() for term in components.split(",") if term.strip()
                 ]
                 if component_terms:
                     per_term_conditions = []
                     for term in component_terms:
-                        safe_term = sanitize_sql_value(term)
-                        per_term_conditions.append(
-                            f"(LOWER(c.CNAME) LIKE '%{safe_term}%' OR LOWER(c.DESCRIPTION) LIKE '%{safe_term}%')"
-                        )
+                        term_pattern = f"%{term}%"
+                        per_term_conditions.append("(c.CNAME ILIKE ? OR c.DESCRIPTION ILIKE ?)")
+                        params.extend([term_pattern, term_pattern])
                     components_condition = "(" + " OR ".join(per_term_conditions) + ")"
                     sql_conditions.append(components_condition)
 
             if fixed_version:
-                sql_conditions.append(f"LOWER(veragg.FIX_VERSIONS) LIKE '%{sanitize_sql_value(fixed_version.lower())}%'")
+                sql_conditions.append("veragg.FIX_VERSIONS ILIKE ?")
+                params.append(f"%{fixed_version}%")
 
             if affected_version:
-                sql_conditions.append(f"LOWER(veragg.AFFECTS_VERSIONS) LIKE '%{sanitize_sql_value(affected_version.lower())}%'")
+                sql_conditions.append("veragg.AFFECTS_VERSIONS ILIKE ?")
+                params.append(f"%{affected_version}%")
 
             # Add date filters - specific date filters take precedence over general timeframe
             date_conditions = []
@@ -163,12 +188,13 @@ def register_tools(mcp: FastMCP) -> None:
             SELECT DISTINCT
                 i.ID, i.ISSUE_KEY, i.PROJECT, i.ISSUENUM, i.ISSUETYPE, i.SUMMARY,
                 SUBSTRING(i.DESCRIPTION, 1, 500) as DESCRIPTION_TRUNCATED,
-                i.DESCRIPTION, i.PRIORITY, i.ISSUESTATUS, i.RESOLUTION,
+                i.PRIORITY, i.ISSUESTATUS, i.RESOLUTION,
                 i.CREATED, i.UPDATED, i.DUEDATE, i.RESOLUTIONDATE,
                 i.VOTES, i.WATCHES, i.ENVIRONMENT, i.COMPONENT, i.FIXFOR,
                 compagg.COMPONENT_NAMES,
                 veragg.FIX_VERSIONS,
-                veragg.AFFECTS_VERSIONS
+                veragg.AFFECTS_VERSIONS,
+                labelagg.LABEL_NAMES
             FROM {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_ISSUE_NON_PII i
             LEFT JOIN {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_NODEASSOCIATION_RHAI na
                 ON i.ID = na.SOURCE_NODE_ID
@@ -198,12 +224,20 @@ def register_tools(mcp: FastMCP) -> None:
                     AND na3.SOURCE_NODE_ENTITY = 'Issue'
                 GROUP BY na3.SOURCE_NODE_ID
             ) veragg ON veragg.ISSUE_ID = i.ID
+            LEFT JOIN (
+                SELECT
+                    l.ISSUE AS ISSUE_ID,
+                    ARRAY_AGG(l.LABEL) AS LABEL_NAMES
+                FROM {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_LABEL_RHAI l
+                WHERE l.LABEL IS NOT NULL
+                GROUP BY l.ISSUE
+            ) labelagg ON labelagg.ISSUE_ID = i.ID
             {where_clause}
             ORDER BY i.CREATED DESC
             LIMIT {limit}
             """
 
-            rows = await execute_snowflake_query(sql, snowflake_token)
+            rows = await execute_snowflake_query(sql, snowflake_token, params=params)
 
             # Aggregate rows by unique issue to avoid duplicates when there are multiple components
             issues_by_id: Dict[str, Dict[str, Any]] = {}
@@ -212,19 +246,21 @@ def register_tools(mcp: FastMCP) -> None:
             # Expected column order based on SELECT statement
             columns = [
                 "ID", "ISSUE_KEY", "PROJECT", "ISSUENUM", "ISSUETYPE", "SUMMARY",
-                "DESCRIPTION_TRUNCATED", "DESCRIPTION", "PRIORITY", "ISSUESTATUS",
+                "DESCRIPTION_TRUNCATED", "PRIORITY", "ISSUESTATUS",
                 "RESOLUTION", "CREATED", "UPDATED", "DUEDATE", "RESOLUTIONDATE",
                 "VOTES", "WATCHES", "ENVIRONMENT", "COMPONENT", "FIXFOR",
-                "COMPONENT_NAMES", "FIX_VERSIONS", "AFFECTS_VERSIONS"
+                "COMPONENT_NAMES", "FIX_VERSIONS", "AFFECTS_VERSIONS", "LABEL_NAMES"
             ]
 
+            # Resolve the timestamp columns once for the whole result set
+            ts_indices = _timestamp_indices(columns)
             for row in rows:
                 # If using connector method, rows are already dictionaries
                 if isinstance(row, dict):
                     row_dict = row
                 else:
                     # API method returns raw rows that need formatting
-                    row_dict = format_snowflake_row(row, columns)
+                    row_dict = format_snowflake_row(row, columns, ts_indices)
 
                 issue_id = row_dict.get("ID")
                 if issue_id is None:
@@ -261,6 +297,8 @@ def register_tools(mcp: FastMCP) -> None:
                         "affected_version": row_dict.get("AFFECTS_VERSIONS") or "",
                         # For backwards-compatibility, keep a single representative component_name if desired
                         "component_name": None,
+                        # Labels are aggregated server-side into a JSON array
+                        "labels": parse_label_array(row_dict.get("LABEL_NAMES")),
                     }
                     issue_ids.append(issue_id_str)
 
@@ -275,18 +313,14 @@ def register_tools(mcp: FastMCP) -> None:
                     # Set a representative component_name for compatibility (first in list)
                     issues_by_id[issue_id_str]["component_name"] = current_components[0] if current_components else None
 
-            # Get labels, comments, and links concurrently for better performance
+            # Labels come back with the issues; links are the only follow-up query
             track_concurrent_operation("issue_enrichment")
-            labels_data, comments_data, links_data, status_changes_data = await get_issue_enrichment_data_concurrent(
-                issue_ids, snowflake_token
-            )
+            links_data = await get_issue_links(issue_ids, snowflake_token)
 
-            # Enrich issues with labels and links (no status changes in list view)
+            # Enrich issues with links (no comments or status changes in list view)
             issues = list(issues_by_id.values())
             for issue in issues:
-                issue_id = str(issue['id'])
-                issue['labels'] = labels_data.get(issue_id, [])
-                issue['links'] = links_data.get(issue_id, [])
+                issue['links'] = links_data.get(str(issue['id']), [])
                 # Don't add comments or status changes to list view to keep it lightweight
                 # Comments and status changes are only added in the detailed view
 
@@ -341,9 +375,8 @@ def register_tools(mcp: FastMCP) -> None:
                     "total_requested": 0
                 }
 
-            # Sanitize all issue keys and build IN clause
-            sanitized_keys = [f"'{sanitize_sql_value(key)}'" for key in issue_keys]
-            in_clause = f"({', '.join(sanitized_keys)})"
+            # Bind each issue key to its own placeholder in the IN clause
+            in_clause = f"({', '.join('?' for _ in issue_keys)})"
 
             sql = f"""
             SELECT DISTINCT
@@ -379,7 +412,7 @@ def register_tools(mcp: FastMCP) -> None:
             ORDER BY i.ISSUE_KEY
             """
 
-            rows = await execute_snowflake_query(sql, snowflake_token)
+            rows = await execute_snowflake_query(sql, snowflake_token, params=issue_keys)
 
             # Expected column order
             columns = [
@@ -397,13 +430,15 @@ def register_tools(mcp: FastMCP) -> None:
             issue_ids = []
             found_keys = set()
 
+            # Resolve the timestamp columns once for the whole result set
+            ts_indices = _timestamp_indices(columns)
             for row in rows:
                 # If using connector method, rows are already dictionaries
                 if isinstance(row, dict):
                     row_dict = row
                 else:
                     # API method returns raw rows that need formatting
-                    row_dict = format_snowflake_row(row, columns)
+                    row_dict = format_snowflake_row(row, columns, ts_indices)
                 issue_key = row_dict.get("ISSUE_KEY")
 
                 if issue_key:
@@ -489,7 +524,7 @@ def register_tools(mcp: FastMCP) -> None:
             if not snowflake_token and SNOWFLAKE_CONNECTION_METHOD == "api":
                 return {"error": "Snowflake token not available"}
 
-            sql = """
+            sql = f"""
             SELECT
                 PROJECT,
                 ISSUESTATUS,
@@ -503,37 +538,41 @@ def register_tools(mcp: FastMCP) -> None:
             rows = await execute_snowflake_query(sql, snowflake_token)
             columns = ["PROJECT", "ISSUESTATUS", "PRIORITY", "COUNT"]
 
-            project_stats = {}
-            total_issues = 0
+            # Single pass over the grouped rows; assemble the nested result afterwards
+            project_totals: Counter = Counter()
+            status_counts: Dict[str, Counter] = defaultdict(Counter)
+            priority_counts: Dict[str, Counter] = defaultdict(Counter)
 
+            # Resolve the timestamp columns once for the whole result set
+            ts_indices = _timestamp_indices(columns)
             for row in rows:
                 # If using connector method, rows are already dictionaries
                 if isinstance(row, dict):
                     row_dict = row
                 else:
                     # API method returns raw rows that need formatting
-                    row_dict = format_snowflake_row(row, columns)
+                    row_dict = format_snowflake_row(row, columns, ts_indices)
 
                 project = row_dict.get("PROJECT", "Unknown")
                 status = row_dict.get("ISSUESTATUS", "Unknown")
                 priority = row_dict.get("PRIORITY", "Unknown")
                 count = int(row_dict.get("COUNT", 0)) if row_dict.get("COUNT") is not None else 0
 
-                if project not in project_stats:
-                    project_stats[project] = {
-                        'total_issues': 0,
-                        'statuses': {},
-                        'priorities': {}
-                    }
-
-                project_stats[project]['total_issues'] += count
-                project_stats[project]['statuses'][status] = project_stats[project]['statuses'].get(status, 0) + count
-                project_stats[project]['priorities'][priority] = project_stats[project]['priorities'].get(priority, 0) + count
+                project_totals[project] += count
+                status_counts[project][status] += count
+                priority_counts[project][priority] += count
 
-                total_issues += count
+            project_stats = {
+                project: {
+                    'total_issues': project_total,
+                    'statuses': dict(status_counts[project]),
+                    'priorities': dict(priority_counts[project])
+                }
+                for project, project_total in project_totals.items()
+            }
 
             return {
-                "total_issues": total_issues,
+                "total_issues": sum(project_totals.values()),
                 "total_projects": len(project_stats),
                 "projects": project_stats
             }
@@ -563,11 +602,11 @@ def register_tools(mcp: FastMCP) -> None:
             sql = f"""
             SELECT ID
             FROM {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_ISSUE_NON_PII
-            WHERE ISSUE_KEY = '{sanitize_sql_value(issue_key)}'
+            WHERE ISSUE_KEY = ?
             LIMIT 1
             """
 
-            rows = await execute_snowflake_query(sql, snowflake_token)
+            rows = await execute_snowflake_query(sql, snowflake_token, params=[issue_key])
 
             if not rows:
                 return {"error": f"Issue with key '{issue_key}' not found"}
@@ -613,10 +652,12 @@ def register_tools(mcp: FastMCP) -> None:
                 return {"error": "Snowflake token not available", "issues": []}
 
             # Build SQL query with sprint filter and optional project filter
-            sql_conditions = [f"s.name = '{sanitize_sql_value(sprint_name)}'"]
+            sql_conditions = ["s.name = ?"]
+            params: List[Any] = [sprint_name]
 
             if project:
-                sql_conditions.append(f"i.PROJECT = '{sanitize_sql_value(project.upper())}'")
+                sql_conditions.append("i.PROJECT = ?")
+                params.append(project.upper())
 
             where_clause = "WHERE " + " AND ".join(sql_conditions)
 
@@ -630,7 +671,6 @@ def register_tools(mcp: FastMCP) -> None:
                 i.ISSUETYPE,
                 i.SUMMARY,
                 SUBSTRING(i.DESCRIPTION, 1, 500) as DESCRIPTION_TRUNCATED,
-                i.DESCRIPTION,
                 i.PRIORITY,
                 i.ISSUESTATUS,
                 i.RESOLUTION,
@@ -647,7 +687,8 @@ def register_tools(mcp: FastMCP) -> None:
                 s.name as SPRINT_NAME,
                 compagg.COMPONENT_NAMES,
                 veragg.FIX_VERSIONS,
-                veragg.AFFECTS_VERSIONS
+                veragg.AFFECTS_VERSIONS,
+                labelagg.LABEL_NAMES
             FROM {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_ISSUE_NON_PII i
             JOIN {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_CUSTOMFIELDVALUE_NON_PII cfv
                 ON i.id = cfv.issue
@@ -682,33 +723,44 @@ def register_tools(mcp: FastMCP) -> None:
                     AND na3.SOURCE_NODE_ENTITY = 'Issue'
                 GROUP BY na3.SOURCE_NODE_ID
             ) veragg ON veragg.ISSUE_ID = i.ID
+            LEFT JOIN (
+                SELECT
+                    l.ISSUE AS ISSUE_ID,
+                    ARRAY_AGG(l.LABEL) AS LABEL_NAMES
+                FROM {SNOWFLAKE_DATABASE}.{SNOWFLAKE_SCHEMA}.JIRA_LABEL_RHAI l
+                WHERE l.LABEL IS NOT NULL
+                GROUP BY l.ISSUE
+            ) labelagg ON labelagg.ISSUE_ID = i.ID
             {where_clause}
             ORDER BY i.CREATED DESC
             LIMIT {limit}
             """
 
-            rows = await execute_snowflake_query(sql, snowflake_token)
+            rows = await execute_snowflake_query(sql, snowflake_token, params=params)
 
             # Expected column order based on SELECT statement
             columns = [
                 "ID", "ISSUE_KEY", "PROJECT", "ISSUENUM", "ISSUETYPE", "SUMMARY",
-                "DESCRIPTION_TRUNCATED", "DESCRIPTION", "PRIORITY", "ISSUESTATUS",
+                "DESCRIPTION_TRUNCATED", "PRIORITY", "ISSUESTATUS",
                 "RESOLUTION", "CREATED", "UPDATED", "DUEDATE", "RESOLUTIONDATE",
                 "VOTES", "WATCHES", "ENVIRONMENT", "COMPONENT", "FIXFOR",
-                "SPRINT_ID", "SPRINT_NAME", "COMPONENT_NAMES", "FIX_VERSIONS", "AFFECTS_VERSIONS"
+                "SPRINT_ID", "SPRINT_NAME", "COMPONENT_NAMES", "FIX_VERSIONS", "AFFECTS_VERSIONS",
+                "LABEL_NAMES"
             ]
 
             # Process all rows and aggregate by unique issue
             issues_by_id: Dict[str, Dict[str, Any]] = {}
             issue_ids: List[str] = []
 
+            # Resolve the timestamp columns once for the whole result set
+            ts_indices = _timestamp_indices(columns)
             for row in rows:
                 # If using connector method, rows are already dictionaries
                 if isinstance(row, dict):
                     row_dict = row
                 else:
                     # API method returns raw rows that need formatting
-                    row_dict = format_snowflake_row(row, columns)
+                    row_dict = format_snowflake_row(row, columns, ts_indices)
 
                 issue_id = row_dict.get("ID")
                 if issue_id is None:
@@ -744,6 +796,7 @@ def register_tools(mcp: FastMCP) -> None:
                         "sprint_id": row_dict.get("SPRINT_ID"),
                         "sprint_name": row_dict.get("SPRINT_NAME"),
                         "component_name": None,
+                        "labels": parse_label_array(row_dict.get("LABEL_NAMES")),
                     }
                     issue_ids.append(issue_id_str)
 
@@ -758,18 +811,14 @@ def register_tools(mcp: FastMCP) -> None:
                     # Set a representative component_name for compatibility (first in list)
                     issues_by_id[issue_id_str]["component_name"] = current_components[0] if current_components else None
 
-            # Get labels, comments, and links concurrently for better performance
+            # Labels come back with the issues; links are the only follow-up query
             track_concurrent_operation("sprint_issue_enrichment")
-            labels_data, comments_data, links_data, status_changes_data = await get_issue_enrichment_data_concurrent(
-                issue_ids, snowflake_token
-            )
+            links_data = await get_issue_links(issue_ids, snowflake_token)
 
-            # Enrich issues with labels and links (no status changes in list view)
+            # Enrich issues with links (no comments or status changes in list view)
             issues = list(issues_by_id.values())
             for issue in issues:
-                issue_id = str(issue['id'])
-                issue['labels'] = labels_data.get(issue_id, [])
-                issue['links'] = links_data.get(issue_id, [])
+                issue['links'] = links_data.get(str(issue['id']), [])
                 # Don't add comments or status changes to list view to keep it lightweight
 
             return {
@@ -140,9 +140,65 @@ class TestConfig:
         # Check the configuration parameters
         call_args = mock_basicconfig.call_args
         assert call_args[1]['level'] == config.logging.INFO
-        assert 'format' in call_args[1]
         assert 'handlers' in call_args[1]
 
+        # Records are routed through a queue to a background listener
+        handlers = call_args[1]['handlers']
+        assert len(handlers) == 1
+        assert isinstance(handlers[0], config.logging.handlers.QueueHandler)
+        assert config._stderr_handler.formatter._fmt == config.LOG_FORMAT
+        assert config._stderr_handler.stream is config.sys.stderr
+        # The queue handler only merges args; LOG_FORMAT is applied once, by the listener
+        assert config._queue_handler.formatter._fmt == '%(message)s'
+
+    def test_stderr_handler_writes_batch_once_queue_drained(self):
+        """Test that records arriving while the queue is busy reach the stream in one write"""
+        import io
+        import logging
+        import config
+
+        class CountingStream(io.StringIO):
+            writes = 0
+
+            def write(self, text):
+                CountingStream.writes += 1
+                return super().write(text)
+
+        pending = config.queue.SimpleQueue()
+        stream = CountingStream()
+        handler = config._BufferedStreamHandler(stream, pending)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+
+        pending.put('more records waiting')
+        for message in ('one', 'two'):
+            handler.emit(logging.makeLogRecord({'msg': message}))
+        assert CountingStream.writes == 0
+
+        pending.get()
+        handler.emit(logging.makeLogRecord({'msg': 'three'}))
+
+        assert CountingStream.writes == 1
+        assert stream.getvalue() == 'one\ntwo\nthree\n'
+
+    def test_stderr_handler_caps_batch_size(self):
+        """Test that a busy queue still writes once the batch reaches its cap"""
+        import io
+        import logging
+        import config
+
+        pending = config.queue.SimpleQueue()
+        pending.put('more records waiting')
+        stream = io.StringIO()
+        handler = config._BufferedStreamHandler(stream, pending)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+
+        with patch.object(config, 'LOG_BATCH_MAX_RECORDS', 2):
+            handler.emit(logging.makeLogRecord({'msg': 'one'}))
+            assert stream.getvalue() == ''
+            handler.emit(logging.makeLogRecord({'msg': 'two'}))
+
+        assert stream.getvalue() == 'one\ntwo\n'
+
     @patch.dict('os.environ', {'INTERNAL_GATEWAY': 'FALSE'})
     def test_internal_gateway_case_insensitive(self):
         """Test that internal gateway configuration is case insensitive"""
@@ -206,7 +262,8 @@ class TestConfig:
         
         try:
             # Mock the import to fail
-            with patch.dict('sys.modules', {'prometheus_client': None}):
+            with patch.dict('sys.modules', {'prometheus_client': None}), \
+                    patch.dict('os.environ', {'ENABLE_METRICS': 'true'}):
                 # Reload config to trigger the import check
                 import config
                 importlib.reload(config)
@@ -218,6 +275,24 @@ class TestConfig:
             if prometheus_module is not None:
                 sys.modules['prometheus_client'] = prometheus_module
 
+    @patch.dict('os.environ', {'ENABLE_METRICS': 'false'})
+    def test_prometheus_not_probed_when_metrics_disabled(self):
+        """Test that prometheus_client is not imported when metrics are disabled"""
+        import sys
+        import importlib
+
+        prometheus_module = sys.modules.pop('prometheus_client', None)
+
+        try:
+            import config
+            importlib.reload(config)
+
+            assert config.PROMETHEUS_AVAILABLE is False
+            assert 'prometheus_client' not in sys.modules
+        finally:
+            if prometheus_module is not None:
+                sys.modules['prometheus_client'] = prometheus_module
+
 
 class TestPerformanceConfig:
     """Test cases for performance configuration"""
@@ -262,6 +337,9 @@ class TestPerformanceConfig:
         assert config.THREAD_POOL_WORKERS == 10
         assert config.RATE_LIMIT_PER_SECOND == 50
         assert config.CONCURRENT_QUERY_BATCH_SIZE == 5
+        assert config.HTTP_RETRY_ATTEMPTS == 3
+        assert config.CIRCUIT_BREAKER_THRESHOLD == 5
+        assert config.CIRCUIT_BREAKER_COOLDOWN_SECONDS == 30
 
     @patch.dict('os.environ', {'ENABLE_CACHING': 'TRUE'})
     def test_caching_enabled_case_insensitive(self):
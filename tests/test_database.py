@@ -1,6 +1,9 @@
 import json
 import os
 import sys
+import asyncio
+import time
+from collections import defaultdict
 import httpx
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -9,7 +12,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
 
 from database import (  # noqa: E402
-    sanitize_sql_value,
+    build_query_bindings,
+    sanitize_issue_ids,
     make_snowflake_request,
     execute_snowflake_query,
     execute_snowflake_query_connector,
@@ -31,39 +35,44 @@ from database import (  # noqa: E402
     set_in_cache,
     clear_cache,
     cleanup_resources,
+    SnowflakeConnectionPool,
+    CircuitBreaker,
     SnowflakeConnectorPool,
     _process_links_rows,
+    _build_request_headers,
+    _is_select,
+    _parse_snowflake_timestamp_cached,
+    _inflight_queries,
+    _finish_inflight_query,
     SNOWFLAKE_CONNECTOR_AVAILABLE
 )
 
 
-class TestSanitizeSqlValue:
-    """Test cases for sanitize_sql_value function"""
+@pytest.fixture(autouse=True)
+def reset_circuit_breaker(monkeypatch):
+    """Give each test a fresh circuit breaker so failures don't leak between tests"""
+    monkeypatch.setattr('database._circuit_breaker', None)
 
-    def test_sanitize_string_with_quotes(self):
-        """Test sanitizing string with single quotes"""
-        result = sanitize_sql_value("test'value")
-        assert result == "test''value"
 
-    def test_sanitize_string_multiple_quotes(self):
-        """Test sanitizing string with multiple single quotes"""
-        result = sanitize_sql_value("test'val'ue'")
-        assert result == "test''val''ue''"
+class TestBuildQueryBindings:
+    """Test cases for build_query_bindings function"""
 
-    def test_sanitize_string_no_quotes(self):
-        """Test sanitizing string without quotes"""
-        result = sanitize_sql_value("test_value")
-        assert result == "test_value"
+    def test_text_and_fixed_bindings(self):
+        """Test that strings bind as TEXT and integers as FIXED"""
+        result = build_query_bindings(["TEST", 42])
+        assert result == {
+            "1": {"type": "TEXT", "value": "TEST"},
+            "2": {"type": "FIXED", "value": "42"}
+        }
 
-    def test_sanitize_non_string(self):
-        """Test sanitizing non-string values"""
-        result = sanitize_sql_value(123)
-        assert result == "123"
+    def test_values_are_not_escaped(self):
+        """Test that bound values are passed through verbatim"""
+        result = build_query_bindings(["PROJ'456"])
+        assert result["1"]["value"] == "PROJ'456"
 
-    def test_sanitize_empty_string(self):
-        """Test sanitizing empty string"""
-        result = sanitize_sql_value("")
-        assert result == ""
+    def test_empty_params(self):
+        """Test that no params produce no bindings"""
+        assert build_query_bindings([]) == {}
 
 
 class TestMakeSnowflakeRequest:
@@ -78,6 +87,7 @@ class TestMakeSnowflakeRequest:
         # Create mock response
         mock_response = MagicMock()
         mock_response.json.return_value = {"data": []}
+        mock_response.content = json.dumps({"data": []}).encode()
         mock_response.raise_for_status = MagicMock()
 
         # Create mock client instance
@@ -110,6 +120,7 @@ class TestMakeSnowflakeRequest:
         """Test that provided token overrides default"""
         mock_response = MagicMock()
         mock_response.json.return_value = {"data": []}
+        mock_response.content = json.dumps({"data": []}).encode()
         mock_response.raise_for_status = MagicMock()
 
         mock_client_instance = AsyncMock()
@@ -125,6 +136,14 @@ class TestMakeSnowflakeRequest:
         headers = kwargs['headers']
         assert headers['Authorization'] == 'Bearer custom_token'
 
+    def test_request_headers_are_shared_per_token(self):
+        """Test that headers are built once per token and cannot be mutated"""
+        headers = _build_request_headers("token_a")
+        assert _build_request_headers("token_a") is headers
+        assert _build_request_headers("token_b")['Authorization'] == 'Bearer token_b'
+        with pytest.raises(TypeError):
+            headers['Authorization'] = 'Bearer other'
+
     @pytest.mark.asyncio
     @patch('database.SNOWFLAKE_TOKEN', 'test_token')
     @patch('database.SNOWFLAKE_BASE_URL', 'https://test.snowflake.com')
@@ -133,6 +152,7 @@ class TestMakeSnowflakeRequest:
         """Test GET request with params"""
         mock_response = MagicMock()
         mock_response.json.return_value = {"data": []}
+        mock_response.content = json.dumps({"data": []}).encode()
         mock_response.raise_for_status = MagicMock()
 
         mock_client_instance = AsyncMock()
@@ -156,6 +176,7 @@ class TestMakeSnowflakeRequest:
         """Test handling of JSON decode error"""
         mock_response = MagicMock()
         mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
+        mock_response.content = b"Invalid JSON"
         mock_response.text = "Invalid response"
         mock_response.raise_for_status = MagicMock()
 
@@ -239,6 +260,38 @@ class TestExecuteSnowflakeQuery:
         assert result[1] == ["row2col1", "row2col2"]
         assert mock_request.call_count == 2
 
+    @pytest.mark.asyncio
+    @patch('database.make_snowflake_request')
+    @patch('database.track_snowflake_query')
+    @patch('database.get_from_cache')
+    @patch('database.set_in_cache')
+    async def test_query_with_multiple_partitions(self, mock_set_cache, mock_get_cache, mock_track, mock_request):
+        """Test that remaining partitions are merged in order and failed partitions are skipped"""
+        mock_get_cache.return_value = None
+
+        partition_responses = {
+            "statements": {
+                "data": [["p0"]],
+                "statementHandle": "handle123",
+                "resultSetMetaData": {
+                    "partitionInfo": [{"startRow": 0}, {"startRow": 1}, {"startRow": 2}, {"startRow": 3}]
+                }
+            },
+            "statements/handle123?partition=1": {"data": [["p1"]]},
+            "statements/handle123?partition=2": None,
+            "statements/handle123?partition=3": {"data": [["p3"]]},
+        }
+
+        async def fake_request(endpoint, method, data, token):
+            return partition_responses[endpoint]
+
+        mock_request.side_effect = fake_request
+
+        result = await execute_snowflake_query("SELECT * FROM test", "token")
+
+        assert result == [["p0"], ["p1"], ["p3"]]
+        assert mock_request.call_count == 4
+
     @pytest.mark.asyncio
     @patch('database.make_snowflake_request')
     @patch('database.track_snowflake_query')
@@ -271,6 +324,34 @@ class TestExecuteSnowflakeQuery:
         assert result == []
         mock_track.assert_called_once()
 
+    @pytest.mark.asyncio
+    @patch('database.make_snowflake_request')
+    @patch('database.track_snowflake_query')
+    async def test_query_with_params_sends_bindings(self, mock_track, mock_request):
+        """Test that query params are sent as SQL API bindings"""
+        mock_request.return_value = {"data": [["row1col1"]]}
+
+        result = await execute_snowflake_query(
+            "SELECT * FROM test WHERE PROJECT = ?", "token", use_cache=False, params=["TEST"]
+        )
+
+        assert result == [["row1col1"]]
+        payload = mock_request.call_args[0][2]
+        assert payload["statement"] == "SELECT * FROM test WHERE PROJECT = ?"
+        assert payload["bindings"] == {"1": {"type": "TEXT", "value": "TEST"}}
+
+    @pytest.mark.asyncio
+    @patch('database.make_snowflake_request')
+    @patch('database.track_snowflake_query')
+    async def test_query_without_params_omits_bindings(self, mock_track, mock_request):
+        """Test that queries without params send no bindings"""
+        mock_request.return_value = {"data": []}
+
+        await execute_snowflake_query("SELECT * FROM test", "token", use_cache=False)
+
+        payload = mock_request.call_args[0][2]
+        assert "bindings" not in payload
+
     @pytest.mark.asyncio
     @patch('database.make_snowflake_request')
     @patch('database.track_snowflake_query')
@@ -377,6 +458,16 @@ class TestParseSnowflakeTimestamp:
             result = parse_snowflake_timestamp(input_timestamp)
             assert result == expected_output
 
+    def test_parse_timestamp_repeated_value_is_cached(self):
+        """Test that parsing the same timestamp twice is served from the cache"""
+        _parse_snowflake_timestamp_cached.cache_clear()
+
+        first = parse_snowflake_timestamp("1753767533.658000000 1440")
+        second = parse_snowflake_timestamp("1753767533.658000000 1440")
+
+        assert first == second == "2025-07-30T05:38:53"
+        assert _parse_snowflake_timestamp_cached.cache_info().hits == 1
+
 
 class TestFormatSnowflakeRow:
     """Test cases for format_snowflake_row function"""
@@ -479,25 +570,59 @@ class TestFormatSnowflakeRow:
         assert "2025-07-30T05:38:53" in result["created"]
         assert "2025-07-30T21:23:31" in result["Updated"]
 
+    def test_format_with_precomputed_timestamp_indices(self):
+        """Test that precomputed timestamp indices decide which columns are parsed"""
+        row_data = ["123", "1753767533.658000000 1440", "1753824211.261000000 1440"]
+        columns = ["id", "created", "updated"]
+
+        result = format_snowflake_row(row_data, columns, frozenset({1}))
+
+        assert "2025-07-30T05:38:53" in result["created"]
+        assert result["updated"] == "1753824211.261000000 1440"
+
+    def test_format_with_empty_timestamp_indices_skips_parsing(self):
+        """Test that an empty precomputed set zips the row without scanning columns or parsing"""
+        row_data = ["123", "1753767533.658000000 1440"]
+        columns = ["id", "created"]
+
+        with patch('database._timestamp_indices') as mock_indices, \
+                patch('database.parse_snowflake_timestamp') as mock_parse:
+            result = format_snowflake_row(row_data, columns, frozenset())
+
+        assert result == {"id": "123", "created": "1753767533.658000000 1440"}
+        mock_indices.assert_not_called()
+        mock_parse.assert_not_called()
+
+
+class TestSanitizeIssueIds:
+    """Test cases for sanitize_issue_ids function"""
+
+    def test_keeps_numeric_ids_as_strings(self):
+        """Test that numeric string and int IDs are kept as strings"""
+        assert sanitize_issue_ids(["123", 456]) == ["123", "456"]
+
+    def test_drops_non_numeric_ids(self):
+        """Test that non-numeric values are filtered out"""
+        assert sanitize_issue_ids(["123", "12'3", None, "abc", 4.5]) == ["123"]
+
+    def test_deduplicates_preserving_order(self):
+        """Test that repeated IDs are removed while keeping first-seen order"""
+        assert sanitize_issue_ids(["456", "123", 456, "123"]) == ["456", "123"]
+
 
 class TestGetIssueLabels:
     """Test cases for get_issue_labels function"""
 
     @pytest.mark.asyncio
     @patch('database.execute_snowflake_query')
-    @patch('database.format_snowflake_row')
-    async def test_get_labels_success(self, mock_format, mock_query):
+    async def test_get_labels_success(self, mock_query):
         """Test successful label retrieval"""
         mock_query.return_value = [
             ["123", "bug"],
             ["123", "urgent"],
-            ["456", "feature"]
-        ]
-
-        mock_format.side_effect = [
-            {"ISSUE": "123", "LABEL": "bug"},
-            {"ISSUE": "123", "LABEL": "urgent"},
-            {"ISSUE": "456", "LABEL": "feature"}
+            ["456", "feature"],
+            ["456", None],
+            ["789"]
         ]
 
         result = await get_issue_labels(["123", "456"], "token")
@@ -527,14 +652,16 @@ class TestGetIssueLabels:
     async def test_get_labels_mixed_valid_invalid_ids(self, mock_query):
         """Test with mix of valid and invalid issue IDs"""
         mock_query.return_value = []
+        clear_cache()  # The cache key only holds the valid IDs, which other tests also use
 
         await get_issue_labels(["123", "abc", "456"], "token")
 
         # Should only query with valid IDs
         mock_query.assert_called_once()
         sql_call = mock_query.call_args[0][0]
-        assert "'123','456'" in sql_call
-        assert "'abc'" not in sql_call
+        assert "FLATTEN(INPUT => PARSE_JSON(?))" in sql_call
+        assert "'123'" not in sql_call
+        assert mock_query.call_args.kwargs['params'] == ['["123", "456"]']
 
     @pytest.mark.asyncio
     @patch('database.execute_snowflake_query')
@@ -545,29 +672,31 @@ class TestGetIssueLabels:
         result = await get_issue_labels(["123"], "token")
         assert result == {}
 
+    @pytest.mark.asyncio
+    @patch('database.set_in_cache')
+    @patch('database.get_from_cache')
+    async def test_get_labels_cache_key_ignores_id_order(self, mock_get_cache, mock_set_cache):
+        """Test that the labels cache key does not depend on the order of issue IDs"""
+        mock_get_cache.return_value = {"123": ["bug"]}
+
+        await get_issue_labels(["456", "123"], "token")
+        await get_issue_labels(["123", "456"], "token")
+
+        first_key, second_key = (call.args[0] for call in mock_get_cache.call_args_list)
+        assert first_key == second_key == ("labels", frozenset({"123", "456"}))
+
 
 class TestGetIssueComments:
     """Test cases for get_issue_comments function"""
 
     @pytest.mark.asyncio
     @patch('database.execute_snowflake_query')
-    @patch('database.format_snowflake_row')
-    async def test_get_comments_success(self, mock_format, mock_query):
+    async def test_get_comments_success(self, mock_query):
         """Test successful comment retrieval"""
         mock_query.return_value = [
             ["comment1", "123", "public", "Comment body 1", "2024-01-01", "2024-01-02"],
-            ["comment2", "123", "private", "Comment body 2", "2024-01-03", "2024-01-04"]
-        ]
-
-        mock_format.side_effect = [
-            {
-                "ID": "comment1", "ISSUEID": "123", "ROLELEVEL": "public",
-                "BODY": "Comment body 1", "CREATED": "2024-01-01", "UPDATED": "2024-01-02"
-            },
-            {
-                "ID": "comment2", "ISSUEID": "123", "ROLELEVEL": "private",
-                "BODY": "Comment body 2", "CREATED": "2024-01-03", "UPDATED": "2024-01-04"
-            }
+            ["comment2", "123", "private", "Comment body 2", "2024-01-03", "2024-01-04"],
+            ["comment3", "123"]
         ]
 
         result = await get_issue_comments(["123"], "token")
@@ -586,6 +715,19 @@ class TestGetIssueComments:
         }
         assert result == expected
 
+    @pytest.mark.asyncio
+    @patch('database.execute_snowflake_query')
+    async def test_get_comments_parses_timestamps(self, mock_query):
+        """Test that Snowflake epoch timestamps in CREATED/UPDATED are converted"""
+        mock_query.return_value = [
+            ["comment1", "123", None, "Body", "1753767533.658000000 0", None]
+        ]
+
+        result = await get_issue_comments(["123"], "token", use_cache=False)
+
+        assert result["123"][0]["created"] == "2025-07-29T05:38:53"
+        assert result["123"][0]["updated"] is None
+
     @pytest.mark.asyncio
     async def test_get_comments_empty_input(self):
         """Test with empty issue IDs list"""
@@ -609,8 +751,7 @@ class TestGetIssueLinks:
 
     @pytest.mark.asyncio
     @patch('database.execute_snowflake_query')
-    @patch('database.format_snowflake_row')
-    async def test_get_links_success(self, mock_format, mock_query):
+    async def test_get_links_success(self, mock_query):
         """Test successful link retrieval"""
         mock_query.return_value = [
             [
@@ -619,13 +760,6 @@ class TestGetIssueLinks:
             ]
         ]
 
-        mock_format.return_value = {
-            "LINK_ID": "link1", "SOURCE": "123", "DESTINATION": "456", "SEQUENCE": "1",
-            "LINKNAME": "blocks", "INWARD": "is blocked by", "OUTWARD": "blocks",
-            "SOURCE_KEY": "TEST-1", "DESTINATION_KEY": "TEST-2",
-            "SOURCE_SUMMARY": "Source summary", "DESTINATION_SUMMARY": "Destination summary"
-        }
-
         result = await get_issue_links(["123"], "token")
 
         assert "123" in result
@@ -634,11 +768,12 @@ class TestGetIssueLinks:
         assert link["relationship"] == "outward"
         assert link["related_issue_id"] == "456"
         assert link["related_issue_key"] == "TEST-2"
+        # Source and destination filters each bind the same ID array
+        assert mock_query.call_args.kwargs['params'] == ['["123"]', '["123"]']
 
     @pytest.mark.asyncio
     @patch('database.execute_snowflake_query')
-    @patch('database.format_snowflake_row')
-    async def test_get_links_bidirectional(self, mock_format, mock_query):
+    async def test_get_links_bidirectional(self, mock_query):
         """Test that links appear for both source and destination issues"""
         mock_query.return_value = [
             [
@@ -647,13 +782,6 @@ class TestGetIssueLinks:
             ]
         ]
 
-        mock_format.return_value = {
-            "LINK_ID": "link1", "SOURCE": "123", "DESTINATION": "456", "SEQUENCE": "1",
-            "LINKNAME": "blocks", "INWARD": "is blocked by", "OUTWARD": "blocks",
-            "SOURCE_KEY": "TEST-1", "DESTINATION_KEY": "TEST-2",
-            "SOURCE_SUMMARY": "Source summary", "DESTINATION_SUMMARY": "Destination summary"
-        }
-
         result = await get_issue_links(["123", "456"], "token")
 
         # Should have links for both issues
@@ -693,31 +821,13 @@ class TestGetIssueStatusChanges:
 
     @pytest.mark.asyncio
     @patch('database.execute_snowflake_query')
-    @patch('database.format_snowflake_row')
-    async def test_get_status_changes_success(self, mock_format, mock_query):
+    async def test_get_status_changes_success(self, mock_query):
         """Test successful status change retrieval"""
         mock_query.return_value = [
             ["ITBEAKER-549", "2025-02-20 15:22:08.961 Z", "New", "In Progress", "New → In Progress"],
             ["ITBEAKER-549", "2025-03-05 13:51:54.818 Z", "In Progress", "Closed", "In Progress → Closed"]
         ]
 
-        mock_format.side_effect = [
-            {
-                "ISSUE_KEY": "ITBEAKER-549",
-                "CHANGE_TIMESTAMP": "2025-02-20 15:22:08.961 Z",
-                "FROM_STATUS": "New",
-                "TO_STATUS": "In Progress",
-                "STATUS_TRANSITION": "New → In Progress"
-            },
-            {
-                "ISSUE_KEY": "ITBEAKER-549",
-                "CHANGE_TIMESTAMP": "2025-03-05 13:51:54.818 Z",
-                "FROM_STATUS": "In Progress",
-                "TO_STATUS": "Closed",
-                "STATUS_TRANSITION": "In Progress → Closed"
-            }
-        ]
-
         result = await get_issue_status_changes(["123"], "token")
 
         assert "ITBEAKER-549" in result
@@ -805,6 +915,14 @@ class TestCacheFunctionality:
         key = get_cache_key("test_op")
         assert key == "test_op"
 
+    def test_is_select(self):
+        """Test SELECT detection ignores leading whitespace and keyword case"""
+        assert _is_select("  \n select * from test")
+        assert _is_select("SELECT 1")
+        assert not _is_select("INSERT INTO test VALUES (1)")
+        assert not _is_select("SEL")
+        assert not _is_select("SELECTED_ROWS")
+
     @patch('database.ENABLE_CACHING', True)
     def test_cache_operations_enabled(self):
         """Test cache operations when caching is enabled"""
@@ -836,6 +954,190 @@ class TestCacheFunctionality:
         assert result is None
 
 
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker"""
+
+    def test_opens_after_threshold(self):
+        """Test that the breaker opens once consecutive failures reach the threshold"""
+        breaker = CircuitBreaker(threshold=2, cooldown=30)
+        breaker.record_failure()
+        assert not breaker.is_open()
+        breaker.record_failure()
+        assert breaker.is_open()
+
+    def test_success_resets_failures(self):
+        """Test that a success clears the failure count"""
+        breaker = CircuitBreaker(threshold=2, cooldown=30)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert not breaker.is_open()
+
+    def test_closes_after_cooldown(self):
+        """Test that the breaker lets requests through again after the cooldown"""
+        breaker = CircuitBreaker(threshold=1, cooldown=0)
+        breaker.record_failure()
+        assert not breaker.is_open()
+
+    def test_half_open_admits_single_probe(self):
+        """Test that only one request is let through after the cooldown until it resolves"""
+        breaker = CircuitBreaker(threshold=1, cooldown=30)
+        breaker.record_failure()
+
+        with patch('database.time.monotonic', return_value=time.monotonic() + 31):
+            assert not breaker.is_open()
+            assert breaker.is_open()
+            breaker.record_success()
+            assert not breaker.is_open()
+            assert not breaker.is_open()
+
+    def test_failed_probe_reopens(self):
+        """Test that a failing half-open probe opens the breaker for another cooldown"""
+        breaker = CircuitBreaker(threshold=2, cooldown=30)
+        breaker.record_failure()
+        breaker.record_failure()
+
+        with patch('database.time.monotonic', return_value=time.monotonic() + 31):
+            assert not breaker.is_open()
+            breaker.record_failure()
+            assert breaker.is_open()
+
+    def test_zero_threshold_disables_breaker(self):
+        """Test that a threshold of 0 never opens the breaker"""
+        breaker = CircuitBreaker(threshold=0, cooldown=30)
+        for _ in range(10):
+            breaker.record_failure()
+        assert not breaker.is_open()
+
+    @pytest.mark.asyncio
+    @patch('database.SNOWFLAKE_TOKEN', 'test_token')
+    @patch('database.get_connection_pool')
+    @patch('database.get_circuit_breaker')
+    async def test_open_breaker_skips_request(self, mock_get_breaker, mock_pool):
+        """Test that make_snowflake_request fails fast while the breaker is open"""
+        mock_get_breaker.return_value.is_open.return_value = True
+
+        result = await make_snowflake_request("statements", "POST", {"statement": "SELECT 1"})
+
+        assert result is None
+        mock_pool.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch('database.SNOWFLAKE_TOKEN', 'test_token')
+    @patch('database.SNOWFLAKE_BASE_URL', 'https://test.snowflake.com')
+    @patch('database.get_connection_pool')
+    @patch('database._throttler')
+    @patch('database.get_circuit_breaker')
+    @patch('database.asyncio.sleep', new_callable=AsyncMock)
+    async def test_server_errors_are_recorded(self, mock_sleep, mock_get_breaker, mock_throttler, mock_pool):
+        """Test that 5xx responses count as failures but 4xx responses do not"""
+        breaker = mock_get_breaker.return_value
+        breaker.is_open.return_value = False
+        mock_throttler.__aenter__ = AsyncMock()
+        mock_throttler.__aexit__ = AsyncMock(return_value=None)
+
+        for status_code in (503, 401):
+            mock_response = MagicMock()
+            mock_response.status_code = status_code
+            mock_client = AsyncMock()
+            mock_client.request = AsyncMock(
+                side_effect=httpx.HTTPStatusError(str(status_code), request=None, response=mock_response)
+            )
+            mock_pool.return_value.get_client = AsyncMock(return_value=mock_client)
+
+            assert await make_snowflake_request("statements", "POST", {"statement": "SELECT 1"}) is None
+
+        breaker.record_failure.assert_called_once()
+
+
+class TestRequestRetries:
+    """Test cases for retrying transient Snowflake API failures"""
+
+    @staticmethod
+    def _status_error(status_code):
+        response = MagicMock()
+        response.status_code = status_code
+        return httpx.HTTPStatusError(str(status_code), request=None, response=response)
+
+    @staticmethod
+    def _setup_client(mock_pool, mock_throttler, side_effect):
+        mock_throttler.__aenter__ = AsyncMock()
+        mock_throttler.__aexit__ = AsyncMock(return_value=None)
+        mock_client = AsyncMock()
+        mock_client.request = AsyncMock(side_effect=side_effect)
+        mock_pool.return_value.get_client = AsyncMock(return_value=mock_client)
+        return mock_client
+
+    @pytest.mark.asyncio
+    @patch('database.SNOWFLAKE_TOKEN', 'test_token')
+    @patch('database.SNOWFLAKE_BASE_URL', 'https://test.snowflake.com')
+    @patch('database.get_connection_pool')
+    @patch('database._throttler')
+    @patch('database.asyncio.sleep', new_callable=AsyncMock)
+    async def test_get_retried_after_transient_error(self, mock_sleep, mock_throttler, mock_pool):
+        """Test that an idempotent GET is retried after a 503 and then succeeds"""
+        ok_response = MagicMock()
+        ok_response.content = b'{"data": [["row"]]}'
+        ok_response.json.return_value = {"data": [["row"]]}
+        mock_client = self._setup_client(mock_pool, mock_throttler, [self._status_error(503), ok_response])
+
+        result = await make_snowflake_request("statements/h?partition=1", "GET", None, use_cache=False)
+
+        assert result == {"data": [["row"]]}
+        assert mock_client.request.call_count == 2
+        mock_sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch('database.SNOWFLAKE_TOKEN', 'test_token')
+    @patch('database.SNOWFLAKE_BASE_URL', 'https://test.snowflake.com')
+    @patch('database.get_connection_pool')
+    @patch('database._throttler')
+    @patch('database.asyncio.sleep', new_callable=AsyncMock)
+    async def test_post_not_resent_after_gateway_error(self, mock_sleep, mock_throttler, mock_pool):
+        """Test that a POST is not re-sent when the statement may already be running"""
+        for status_code in (502, 503):
+            mock_client = self._setup_client(mock_pool, mock_throttler, self._status_error(status_code))
+
+            result = await make_snowflake_request("statements", "POST", {"statement": "SELECT 1"})
+
+            assert result is None
+            mock_client.request.assert_called_once()
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @patch('database.SNOWFLAKE_TOKEN', 'test_token')
+    @patch('database.SNOWFLAKE_BASE_URL', 'https://test.snowflake.com')
+    @patch('database.get_connection_pool')
+    @patch('database._throttler')
+    @patch('database.asyncio.sleep', new_callable=AsyncMock)
+    async def test_get_connect_error_left_to_transport_retries(self, mock_sleep, mock_throttler, mock_pool):
+        """Test that connection failures are not retried again on top of the transport's retries"""
+        mock_client = self._setup_client(mock_pool, mock_throttler, httpx.ConnectError("unreachable"))
+
+        result = await make_snowflake_request("statements/h?partition=1", "GET", None, use_cache=False)
+
+        assert result is None
+        mock_client.request.assert_called_once()
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @patch('database.SNOWFLAKE_TOKEN', 'test_token')
+    @patch('database.SNOWFLAKE_BASE_URL', 'https://test.snowflake.com')
+    @patch('database.HTTP_RETRY_ATTEMPTS', 3)
+    @patch('database.get_connection_pool')
+    @patch('database._throttler')
+    @patch('database.asyncio.sleep', new_callable=AsyncMock)
+    async def test_post_resent_when_throttled_until_attempts_run_out(self, mock_sleep, mock_throttler, mock_pool):
+        """Test that a throttled POST is re-sent at most HTTP_RETRY_ATTEMPTS times"""
+        mock_client = self._setup_client(mock_pool, mock_throttler, self._status_error(429))
+
+        result = await make_snowflake_request("statements", "POST", {"statement": "SELECT 1"})
+
+        assert result is None
+        assert mock_client.request.call_count == 3
+        assert mock_sleep.await_count == 2
+
+
 class TestConnectionPool:
     """Test cases for connection pool functionality"""
 
@@ -860,6 +1162,15 @@ class TestConnectionPool:
         assert client is not None
         assert hasattr(client, 'request')
 
+    @pytest.mark.asyncio
+    async def test_connection_pool_reuses_client(self):
+        """Test that repeated calls return the same open client"""
+        pool = SnowflakeConnectionPool()
+        client1 = await pool.get_client()
+        client2 = await pool.get_client()
+        assert client1 is client2
+        await pool.close()
+
     @pytest.mark.asyncio
     async def test_cleanup_resources(self):
         """Test resource cleanup"""
@@ -870,6 +1181,39 @@ class TestConnectionPool:
 class TestMakeSnowflakeRequestWithCaching:
     """Test cases for make_snowflake_request with caching"""
 
+    @pytest.mark.asyncio
+    @patch('database.SNOWFLAKE_TOKEN', 'test_token')
+    @patch('database.SNOWFLAKE_BASE_URL', 'https://test.snowflake.com')
+    @patch('database.ORJSON_AVAILABLE', True)
+    @patch('database.orjson', create=True)
+    @patch('database.get_connection_pool')
+    @patch('database._throttler')
+    async def test_request_uses_orjson_when_available(self, mock_throttler, mock_pool, mock_orjson):
+        """Test that request and response bodies go through orjson when it is installed"""
+        mock_client = AsyncMock()
+        mock_response = MagicMock()
+        mock_response.content = b'{"data": "test"}'
+        mock_response.raise_for_status = MagicMock()
+        mock_client.request = AsyncMock(return_value=mock_response)
+
+        mock_pool_instance = MagicMock()
+        mock_pool_instance.get_client = AsyncMock(return_value=mock_client)
+        mock_pool.return_value = mock_pool_instance
+
+        mock_throttler.__aenter__ = AsyncMock()
+        mock_throttler.__aexit__ = AsyncMock()
+
+        mock_orjson.loads.return_value = {"data": "test"}
+
+        result = await make_snowflake_request("test", "POST", {"statement": "SELECT 1"})
+
+        assert result == {"data": "test"}
+        mock_orjson.loads.assert_called_once_with(b'{"data": "test"}')
+        mock_response.json.assert_not_called()
+        # The POST body is serialized with orjson too
+        mock_orjson.dumps.assert_called_once_with({"statement": "SELECT 1"})
+        assert mock_client.request.call_args.kwargs['content'] is mock_orjson.dumps.return_value
+
     @pytest.mark.asyncio
     @patch('database.SNOWFLAKE_TOKEN', 'test_token')
     @patch('database.SNOWFLAKE_BASE_URL', 'https://test.snowflake.com')
@@ -881,6 +1225,7 @@ class TestMakeSnowflakeRequestWithCaching:
         mock_client = AsyncMock()
         mock_response = MagicMock()
         mock_response.json.return_value = {"data": "test"}
+        mock_response.content = json.dumps({"data": "test"}).encode()
         mock_response.raise_for_status = MagicMock()
         mock_client.request = AsyncMock(return_value=mock_response)
         
@@ -912,6 +1257,7 @@ class TestMakeSnowflakeRequestWithCaching:
         mock_client = AsyncMock()
         mock_response = MagicMock()
         mock_response.json.return_value = {"data": "test"}
+        mock_response.content = json.dumps({"data": "test"}).encode()
         mock_response.raise_for_status = MagicMock()
         mock_client.request = AsyncMock(return_value=mock_response)
         
@@ -958,15 +1304,96 @@ class TestExecuteSnowflakeQueryWithCaching:
         assert result == [["row1", "row2"]]
         mock_request.assert_called_once()
 
+    @pytest.mark.asyncio
+    @patch('database.make_snowflake_request')
+    @patch('database.track_snowflake_query')
+    @patch('database.get_from_cache', return_value=None)
+    @patch('database.set_in_cache')
+    async def test_concurrent_identical_queries_share_one_request(self, mock_set_cache, mock_get_cache, mock_track, mock_request):
+        """Test that identical SELECTs in flight at the same time issue a single request"""
+        release = asyncio.Event()
+
+        async def slow_request(*args, **kwargs):
+            await release.wait()
+            return {"data": [["row1"]]}
+
+        mock_request.side_effect = slow_request
+
+        first = asyncio.create_task(execute_snowflake_query("SELECT * FROM shared", "token"))
+        second = asyncio.create_task(execute_snowflake_query("SELECT * FROM shared", "token"))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await first == [["row1"]]
+        assert await second == [["row1"]]
+        mock_request.assert_called_once()
+        assert _inflight_queries == {}
+
+    @pytest.mark.asyncio
+    @patch('database.make_snowflake_request')
+    @patch('database.track_snowflake_query')
+    @patch('database.get_from_cache', return_value=None)
+    @patch('database.set_in_cache')
+    async def test_identical_queries_with_different_tokens_are_not_shared(self, mock_set_cache, mock_get_cache, mock_track, mock_request):
+        """Test that callers with different tokens each issue their own request"""
+        release = asyncio.Event()
+
+        async def slow_request(endpoint, method, data, snowflake_token):
+            await release.wait()
+            return {"data": [["row1"]]} if snowflake_token == "good-token" else None
+
+        mock_request.side_effect = slow_request
+
+        bad = asyncio.create_task(execute_snowflake_query("SELECT * FROM shared", "bad-token"))
+        good = asyncio.create_task(execute_snowflake_query("SELECT * FROM shared", "good-token"))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await bad == []
+        assert await good == [["row1"]]
+        assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_query_error_is_retrieved_when_callers_cancelled(self):
+        """Test that a failed shared query's error is retrieved once it finishes"""
+        async def fail():
+            raise RuntimeError("boom")
+
+        task = asyncio.ensure_future(fail())
+        _inflight_queries["key"] = task
+        await asyncio.gather(task, return_exceptions=True)
+
+        with patch('database.logger') as mock_logger:
+            _finish_inflight_query("key", task)
+
+        assert "key" not in _inflight_queries
+        mock_logger.debug.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch('database.make_snowflake_request')
+    @patch('database.track_snowflake_query')
+    @patch('database.get_from_cache', return_value=None)
+    @patch('database.set_in_cache')
+    async def test_uncached_queries_are_not_coalesced(self, mock_set_cache, mock_get_cache, mock_track, mock_request):
+        """Test that use_cache=False queries always run on their own"""
+        mock_request.return_value = {"data": [["row1"]]}
+
+        await asyncio.gather(
+            execute_snowflake_query("SELECT * FROM shared", "token", use_cache=False),
+            execute_snowflake_query("SELECT * FROM shared", "token", use_cache=False),
+        )
+
+        assert mock_request.call_count == 2
+
 
 class TestConcurrentFunctions:
     """Test cases for concurrent processing functions"""
 
     @pytest.mark.asyncio
-    @patch('database.get_issue_labels')
-    @patch('database.get_issue_comments') 
-    @patch('database.get_issue_links')
-    @patch('database.get_issue_status_changes')
+    @patch('database._fetch_issue_labels')
+    @patch('database._fetch_issue_comments') 
+    @patch('database._fetch_issue_links')
+    @patch('database._fetch_issue_status_changes')
     async def test_get_issue_enrichment_data_concurrent_success(self, mock_status_changes, mock_links, mock_comments, mock_labels):
         """Test successful concurrent data enrichment"""
         # Setup mocks
@@ -988,6 +1415,28 @@ class TestConcurrentFunctions:
         mock_links.assert_called_once_with(["123"], "token", True)
         mock_status_changes.assert_called_once_with(["123"], "token", True)
 
+    @pytest.mark.asyncio
+    @patch('database._fetch_issue_labels')
+    @patch('database._fetch_issue_comments')
+    @patch('database._fetch_issue_links')
+    @patch('database._fetch_issue_status_changes')
+    async def test_get_issue_enrichment_data_concurrent_sanitizes_once(self, mock_status_changes, mock_links, mock_comments, mock_labels):
+        """Test that IDs are sanitized once, and the fetch helpers are skipped when none are valid"""
+        for mock in (mock_labels, mock_comments, mock_links, mock_status_changes):
+            mock.return_value = {}
+
+        with patch('database.sanitize_issue_ids', wraps=sanitize_issue_ids) as mock_sanitize:
+            await get_issue_enrichment_data_concurrent(["123", "abc", 123, "456"], "token")
+
+        mock_sanitize.assert_called_once()
+        for mock in (mock_labels, mock_comments, mock_links, mock_status_changes):
+            mock.assert_called_once_with(["123", "456"], "token", True)
+
+        result = await get_issue_enrichment_data_concurrent(["abc"], "token")
+
+        assert result == ({}, {}, {}, {})
+        assert mock_labels.call_count == 1
+
     @pytest.mark.asyncio
     async def test_get_issue_enrichment_data_concurrent_empty_input(self):
         """Test concurrent data enrichment with empty input"""
@@ -999,10 +1448,10 @@ class TestConcurrentFunctions:
         assert status_changes == {}
 
     @pytest.mark.asyncio
-    @patch('database.get_issue_labels')
-    @patch('database.get_issue_comments') 
-    @patch('database.get_issue_links')
-    @patch('database.get_issue_status_changes')
+    @patch('database._fetch_issue_labels')
+    @patch('database._fetch_issue_comments') 
+    @patch('database._fetch_issue_links')
+    @patch('database._fetch_issue_status_changes')
     async def test_get_issue_enrichment_data_concurrent_with_exception(self, mock_status_changes, mock_links, mock_comments, mock_labels):
         """Test concurrent data enrichment with one function failing"""
         # Setup mocks - one fails, others succeed
@@ -1065,26 +1514,16 @@ class TestConcurrentFunctions:
         assert results[1] == []  # Failed query returns empty list
 
     @pytest.mark.asyncio
-    @patch('database._thread_pool')
-    async def test_format_snowflake_rows_concurrent_small_dataset(self, mock_thread_pool):
-        """Test concurrent row formatting with small dataset"""
-        import asyncio
-        
+    async def test_format_snowflake_rows_concurrent_small_dataset(self):
+        """Test that a dataset fitting in one batch is formatted inline"""
         rows = [["val1", "val2"], ["val3", "val4"]]
         columns = ["col1", "col2"]
-        
-        # Mock the thread pool execution
-        expected_result = [{"col1": "val1", "col2": "val2"}, {"col1": "val3", "col2": "val4"}]
-        
-        loop = asyncio.get_event_loop()
-        future = asyncio.Future()
-        future.set_result(expected_result)
-        loop.run_in_executor = AsyncMock(return_value=expected_result)
-        
-        with patch('database.asyncio.get_event_loop', return_value=loop):
+
+        with patch('database.asyncio.get_event_loop') as mock_get_loop:
             result = await format_snowflake_rows_concurrent(rows, columns, batch_size=100)
-        
-        assert result == expected_result
+
+        assert result == [{"col1": "val1", "col2": "val2"}, {"col1": "val3", "col2": "val4"}]
+        mock_get_loop.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_format_snowflake_rows_concurrent_empty_input(self):
@@ -1138,6 +1577,7 @@ class TestSnowflakeConnectorPool:
         assert params['user'] == 'test-user'
         assert params['password'] == 'test-password'
         assert params['role'] == 'test-role'
+        assert params['paramstyle'] == 'qmark'
 
     @patch('database.SNOWFLAKE_CONNECTOR_AVAILABLE', True)
     @patch('database.SNOWFLAKE_ACCOUNT', 'test-account')
@@ -1317,7 +1757,7 @@ class TestConnectorQueries:
         
         result = await execute_snowflake_query("SELECT * FROM test", use_cache=False)
         
-        mock_connector_query.assert_called_once_with("SELECT * FROM test", False)
+        mock_connector_query.assert_called_once_with("SELECT * FROM test", False, None)
         assert result == [{"id": 1, "name": "test"}]
 
     @pytest.mark.asyncio
@@ -1337,7 +1777,7 @@ class TestConnectorQueries:
         
         result = await execute_snowflake_query("SELECT * FROM test", "token")
         
-        mock_api_query.assert_called_once_with("SELECT * FROM test", "token", True)
+        mock_api_query.assert_called_once_with("SELECT * FROM test", "token", True, None)
         assert result == [{"id": 1, "name": "test"}]
 
     @pytest.mark.asyncio
@@ -1397,6 +1837,25 @@ class TestConnectorQueries:
         assert result[0]["CREATED"] == "2023-01-01T10:00:00"
         mock_cursor.close.assert_called_once()
 
+    @patch('database.get_connector_pool')
+    def test_execute_connector_query_sync_with_params(self, mock_get_pool):
+        """Test that params are passed to the cursor for server-side binding"""
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [("TEST-1",)]
+        mock_cursor.description = [("ISSUE_KEY",)]
+
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+
+        mock_pool = MagicMock()
+        mock_pool.get_connection.return_value = mock_connection
+        mock_get_pool.return_value = mock_pool
+
+        result = _execute_connector_query_sync("SELECT ISSUE_KEY FROM test WHERE PROJECT = ?", ["TEST"])
+
+        mock_cursor.execute.assert_called_once_with("SELECT ISSUE_KEY FROM test WHERE PROJECT = ?", ["TEST"])
+        assert result == [{"ISSUE_KEY": "TEST-1"}]
+
     @patch('database.get_connector_pool')
     def test_execute_connector_query_sync_snowflake_error(self, mock_get_pool):
         """Test synchronous connector query with Snowflake error"""
@@ -1484,7 +1943,7 @@ class TestProcessLinksRows:
         ]
         
         sanitized_ids = ["100", "200"]
-        links_data = {}
+        links_data = defaultdict(list)
         
         _process_links_rows(rows, sanitized_ids, links_data)
         
@@ -1524,7 +1983,7 @@ class TestProcessLinksRows:
         
         # Only include source ID in sanitized_ids
         sanitized_ids = ["100"]
-        links_data = {}
+        links_data = defaultdict(list)
         
         _process_links_rows(rows, sanitized_ids, links_data)
         
@@ -1533,11 +1992,40 @@ class TestProcessLinksRows:
         assert "200" not in links_data
         assert len(links_data["100"]) == 1
 
+    def test_process_links_rows_positional(self):
+        """Test that API list rows are unpacked positionally and malformed rows skipped"""
+        rows = [
+            ["1", "100", "200", 1, "blocks", "is blocked by", "blocks",
+             "PROJ-100", "PROJ-200", "Source issue", "Dest issue"],
+            ["2", "100"]
+        ]
+        links_data = defaultdict(list)
+
+        _process_links_rows(rows, ["100"], links_data, use_dict_rows=False)
+
+        assert len(links_data["100"]) == 1
+        link = links_data["100"][0]
+        assert link["link_id"] == "1"
+        assert link["related_issue_key"] == "PROJ-200"
+        assert link["related_issue_summary"] == "Dest issue"
+
+    def test_process_links_rows_self_link_listed_both_ways(self):
+        """Test that a link from an issue to itself is recorded as outward and inward"""
+        rows = [
+            ["1", "100", "100", 1, "relates", "relates to", "relates to",
+             "PROJ-100", "PROJ-100", "Same issue", "Same issue"]
+        ]
+        links_data = defaultdict(list)
+
+        _process_links_rows(rows, ["100"], links_data, use_dict_rows=False)
+
+        assert [link["relationship"] for link in links_data["100"]] == ["outward", "inward"]
+
     def test_process_links_rows_empty(self):
         """Test links processing with empty input"""
         rows = []
         sanitized_ids = ["100"]
-        links_data = {}
+        links_data = defaultdict(list)
         
         _process_links_rows(rows, sanitized_ids, links_data)
         
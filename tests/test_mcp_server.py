@@ -37,7 +37,7 @@ class TestMCPServer:
         mock_start_metrics.assert_called_once()
         
         # Verify MCP server was run with correct transport
-        mock_mcp_instance.run.assert_called_once_with(transport='stdio')
+        mock_mcp_instance.run.assert_called_once_with(transport='stdio', mount_path=None)
         
         # Verify cleanup was called
         mock_set_connections.assert_called_with(0)
@@ -55,7 +55,7 @@ class TestMCPServer:
         main()
         
         # Verify MCP server was run with HTTP transport
-        mock_mcp_instance.run.assert_called_once_with(transport='http')
+        mock_mcp_instance.run.assert_called_once_with(transport='http', mount_path=None)
 
     @patch('mcp_server.set_active_connections')
     @patch('mcp_server.start_metrics_thread')
@@ -186,7 +186,7 @@ class TestMCPServer:
             main()
         
         # Verify error log message
-        mock_logger.error.assert_called_once_with(f"Error running MCP server: {test_error}")
+        mock_logger.error.assert_called_once_with("Error running MCP server: %s", test_error)
 
     @patch('mcp_server.set_active_connections')
     @patch('mcp_server.start_metrics_thread')
@@ -359,7 +359,7 @@ class TestMainIntegration:
         mock_start_metrics.assert_called_once()
         
         # Verify server run
-        mock_mcp_instance.run.assert_called_once_with(transport='stdio')
+        mock_mcp_instance.run.assert_called_once_with(transport='stdio', mount_path=None)
         
         # Verify cleanup sequence
         mock_set_connections.assert_called_with(0)
@@ -368,4 +368,64 @@ class TestMainIntegration:
         # Verify logging
         info_calls = [call[0][0] for call in mock_logger.info.call_args_list]
         assert any("Starting JIRA MCP Server" in call for call in info_calls)
-        assert any("shutdown complete" in call for call in info_calls)
\ No newline at end of file
+        assert any("shutdown complete" in call for call in info_calls)
+
+    @patch('mcp_server.MCP_TRANSPORT', 'stdio')
+    def test_fast_loop_factory_skips_stdio(self):
+        """Test that the stdio transport keeps the default event loop"""
+        from mcp_server import get_fast_loop_factory
+
+        with patch.dict(sys.modules, {'uvloop': MagicMock()}):
+            assert get_fast_loop_factory() is None
+
+    @patch('mcp_server.MCP_TRANSPORT', 'sse')
+    @patch('mcp_server.sys.platform', 'linux')
+    def test_fast_loop_factory_uses_uvloop(self):
+        """Test that network transports use uvloop's loop factory when available"""
+        from mcp_server import get_fast_loop_factory
+
+        mock_uvloop = MagicMock()
+        with patch.dict(sys.modules, {'uvloop': mock_uvloop}):
+            assert get_fast_loop_factory() is mock_uvloop.new_event_loop
+
+    @patch('mcp_server.MCP_TRANSPORT', 'sse')
+    @patch('mcp_server.sys.platform', 'linux')
+    def test_fast_loop_factory_without_uvloop(self):
+        """Test that a missing uvloop falls back to the default event loop"""
+        from mcp_server import get_fast_loop_factory
+
+        with patch.dict(sys.modules, {'uvloop': None}):
+            assert get_fast_loop_factory() is None
+
+    @patch('mcp_server.MCP_TRANSPORT', 'streamable-http')
+    @patch('mcp_server.anyio.run')
+    @patch('mcp_server.get_fast_loop_factory')
+    def test_run_server_passes_loop_factory_to_anyio(self, mock_get_factory, mock_anyio_run):
+        """Test that uvloop is handed to anyio as the loop factory for the transport coroutine"""
+        from mcp_server import run_server
+
+        mock_mcp = MagicMock()
+        run_server(mock_mcp)
+
+        mock_anyio_run.assert_called_once_with(
+            mock_mcp.run_streamable_http_async,
+            backend_options={"loop_factory": mock_get_factory.return_value},
+        )
+        mock_mcp.run.assert_not_called()
+
+    @patch('mcp_server.MCP_TRANSPORT', 'sse')
+    @patch('mcp_server.anyio.run')
+    @patch('mcp_server.get_fast_loop_factory')
+    def test_run_server_passes_sse_mount_path(self, mock_get_factory, mock_anyio_run):
+        """Test that the sse runner gets the mount path, as FastMCP.run() passes it"""
+        from mcp_server import run_server
+
+        mock_mcp = MagicMock()
+        run_server(mock_mcp, mount_path="/jira")
+
+        mock_anyio_run.assert_called_once_with(
+            mock_mcp.run_sse_async,
+            "/jira",
+            backend_options={"loop_factory": mock_get_factory.return_value},
+        )
+        mock_mcp.run.assert_not_called()
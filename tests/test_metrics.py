@@ -299,6 +299,7 @@ class TestMetricsHandler:
             # Verify response
             handler.send_response.assert_called_once_with(200)
             handler.send_header.assert_any_call('Content-Type', 'application/json')
+            handler.send_header.assert_any_call('Content-Length', '21')
             handler.end_headers.assert_called_once()
             handler.wfile.write.assert_called_once_with(b'{"status": "healthy"}')
 
@@ -368,7 +369,7 @@ class TestStartMetricsServer:
             call_args = mock_server.call_args[0]
             assert call_args[0] == ("", 8000)  # Address and port
             assert mock_httpd.allow_reuse_address is True
-            mock_httpd.serve_forever.assert_called_once()
+            mock_httpd.serve_forever.assert_called_once_with(poll_interval=3600.0)
 
     @patch('metrics.ENABLE_METRICS', False)
     @patch('metrics.PROMETHEUS_AVAILABLE', True)
@@ -397,7 +398,7 @@ class TestStartMetricsServer:
             start_metrics_server()
             
             # Verify error was logged
-            mock_logger.error.assert_called_once_with("Failed to start metrics server: Server error")
+            mock_logger.error.assert_called_once_with("Failed to start metrics server: %s", mock_server.side_effect)
 
 
 class TestDecoratorFunctionality:
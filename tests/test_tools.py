@@ -6,7 +6,7 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
 
-from tools import get_snowflake_token, register_tools
+from tools import get_snowflake_token, parse_label_array, register_tools
 
 
 class TestGetSnowflakeToken:
@@ -86,6 +86,25 @@ class TestGetSnowflakeToken:
         assert token is None
 
 
+class TestParseLabelArray:
+    """Test cases for parse_label_array function"""
+
+    def test_decodes_json_array(self):
+        """Test that a JSON array string is decoded in stored order"""
+        assert parse_label_array('["b||c", "a", "a"]') == ["b||c", "a", "a"]
+
+    def test_accepts_decoded_list(self):
+        """Test that an already-decoded list is returned as is"""
+        assert parse_label_array(["a", None, "b"]) == ["a", "b"]
+
+    def test_empty_and_invalid_values(self):
+        """Test that missing or malformed values give no labels"""
+        assert parse_label_array(None) == []
+        assert parse_label_array("") == []
+        assert parse_label_array("not json") == []
+        assert parse_label_array('{"a": 1}') == []
+
+
 class TestRegisterTools:
     """Test cases for register_tools function and individual tool implementations"""
 
@@ -111,21 +130,21 @@ class TestRegisterTools:
         with patch('tools.get_snowflake_token') as mock_token, \
              patch('tools.execute_snowflake_query') as mock_query, \
              patch('tools.get_issue_enrichment_data_concurrent') as mock_enrichment, \
-             patch('tools.format_snowflake_row') as mock_format, \
-             patch('tools.sanitize_sql_value') as mock_sanitize:
+             patch('tools.get_issue_links') as mock_links, \
+             patch('tools.format_snowflake_row') as mock_format:
             
             mock_token.return_value = 'test_token'
             mock_query.return_value = []
             mock_enrichment.return_value = ({}, {}, {}, {})  # labels, comments, links, status_changes
+            mock_links.return_value = {}
             mock_format.return_value = {}
-            mock_sanitize.side_effect = lambda x: str(x).replace("'", "''")
             
             yield {
                 'token': mock_token,
                 'query': mock_query,
                 'enrichment': mock_enrichment,
-                'format': mock_format,
-                'sanitize': mock_sanitize
+                'links': mock_links,
+                'format': mock_format
             }
 
     def test_register_tools(self, mock_mcp):
@@ -207,11 +226,13 @@ class TestRegisterTools:
         # Verify SQL conditions were built correctly
         mock_dependencies['query'].assert_called_once()
         sql_call = mock_dependencies['query'].call_args[0][0]
-        assert "i.PROJECT = 'TEST'" in sql_call
-        assert "i.ISSUETYPE = 'Bug'" in sql_call
-        assert "i.ISSUESTATUS = 'Open'" in sql_call
-        assert "i.PRIORITY = 'High'" in sql_call
-        assert "LOWER(i.SUMMARY) LIKE '%test search%'" in sql_call
+        params = mock_dependencies['query'].call_args.kwargs['params']
+        assert "i.PROJECT = ?" in sql_call
+        assert "i.ISSUETYPE = ?" in sql_call
+        assert "i.ISSUESTATUS = ?" in sql_call
+        assert "i.PRIORITY = ?" in sql_call
+        assert "(i.SUMMARY ILIKE ? OR i.DESCRIPTION ILIKE ?)" in sql_call
+        assert params == ['TEST', 'Bug', 'Open', 'High', '%test search%', '%test search%']
         
         # Verify timeframe condition is included (filters by ANY date: created, updated, or resolved)
         timeframe_condition = "(i.CREATED >= DATEADD(DAY, -14, CURRENT_TIMESTAMP()) OR i.UPDATED >= DATEADD(DAY, -14, CURRENT_TIMESTAMP()) OR i.RESOLUTIONDATE >= DATEADD(DAY, -14, CURRENT_TIMESTAMP()))"
@@ -287,7 +308,7 @@ class TestRegisterTools:
              None, None, None, '7200', '3600', '1800', 'WF-2', None, 'N', None, None, None, None, None]
         ]
         
-        def mock_format_side_effect(row, columns):
+        def mock_format_side_effect(row, columns, ts_indices=None):
             row_dict = dict(zip(columns, row))
             return row_dict
         
@@ -323,7 +344,7 @@ class TestRegisterTools:
              None, None, None, '3600', '1800', '900', 'WF-1', None, 'N', None, None, None, None, None]
         ]
         
-        def mock_format_side_effect(row, columns):
+        def mock_format_side_effect(row, columns, ts_indices=None):
             return dict(zip(columns, row))
         
         mock_dependencies['format'].side_effect = mock_format_side_effect
@@ -384,7 +405,7 @@ class TestRegisterTools:
              None, None, None, '3600', '1800', '900', 'WF-1', None, 'N', None, None, None, None, None]
         ]
         
-        def mock_format_side_effect(row, columns):
+        def mock_format_side_effect(row, columns, ts_indices=None):
             return dict(zip(columns, row))
         
         mock_dependencies['format'].side_effect = mock_format_side_effect
@@ -418,7 +439,7 @@ class TestRegisterTools:
             ['PROD', 'Closed', 'Low', '3']
         ]
         
-        def mock_format_side_effect(row, columns):
+        def mock_format_side_effect(row, columns, ts_indices=None):
             return dict(zip(columns, row))
         
         mock_dependencies['format'].side_effect = mock_format_side_effect
@@ -433,6 +454,25 @@ class TestRegisterTools:
         assert 'TEST' in result['projects']
         assert 'PROD' in result['projects']
         assert result['projects']['TEST']['total_issues'] == 15
+        assert result['projects']['TEST']['statuses'] == {'Open': 15}
+        assert result['projects']['TEST']['priorities'] == {'High': 5, 'Medium': 10}
+        assert result['projects']['PROD']['statuses'] == {'Closed': 3}
+
+    @pytest.mark.asyncio
+    @patch('tools.SNOWFLAKE_DATABASE', 'JIRA_DB')
+    @patch('tools.SNOWFLAKE_SCHEMA', 'JIRA_SCHEMA')
+    async def test_get_jira_project_summary_uses_configured_table_path(self, mock_mcp, mock_dependencies):
+        """Test that the summary query reads from the configured database and schema"""
+        mock_dependencies['query'].return_value = []
+
+        register_tools(mock_mcp)
+        get_jira_project_summary = mock_mcp._registered_tools[2]
+
+        await get_jira_project_summary()
+
+        sql_call = mock_dependencies['query'].call_args[0][0]
+        assert "{SNOWFLAKE_DATABASE}" not in sql_call
+        assert "FROM JIRA_DB.JIRA_SCHEMA.JIRA_ISSUE_NON_PII" in sql_call
 
     @pytest.mark.asyncio
     async def test_list_jira_issues_with_component_filters(self, mock_mcp, mock_dependencies):
@@ -450,8 +490,9 @@ class TestRegisterTools:
         # Verify SQL conditions were built correctly for component filters
         mock_dependencies['query'].assert_called_once()
         sql_call = mock_dependencies['query'].call_args[0][0]
-        assert "LOWER(c.CNAME) LIKE '%frontend%'" in sql_call
+        assert "(c.CNAME ILIKE ? OR c.DESCRIPTION ILIKE ?)" in sql_call
         assert "JOIN None.None.JIRA_COMPONENT_RHAI c" in sql_call
+        assert mock_dependencies['query'].call_args.kwargs['params'] == ['TEST', '%frontend%', '%frontend%']
         
         # Verify filters_applied includes component filters
         assert result['filters_applied']['components'] == 'frontend'
@@ -471,7 +512,11 @@ class TestRegisterTools:
         sql_call = mock_dependencies['query'].call_args[0][0]
         assert "LEFT JOIN None.None.JIRA_COMPONENT_RHAI c" in sql_call
         assert "LEFT JOIN None.None.JIRA_NODEASSOCIATION_RHAI na" in sql_call
-        assert "i.PROJECT = 'TEST'" in sql_call  # Should always have table alias now
+        assert "i.PROJECT = ?" in sql_call  # Should always have table alias now
+        # Only the truncated description is selected for list views
+        assert "SUBSTRING(i.DESCRIPTION, 1, 500) as DESCRIPTION_TRUNCATED" in sql_call
+        assert sql_call.count("i.DESCRIPTION") == 1
+        assert mock_dependencies['query'].call_args.kwargs['params'] == ['TEST']
 
     @pytest.mark.asyncio
     async def test_list_jira_issues_with_multiple_component_filters_sql(self, mock_mcp, mock_dependencies):
@@ -486,11 +531,11 @@ class TestRegisterTools:
 
         mock_dependencies['query'].assert_called_once()
         sql_call = mock_dependencies['query'].call_args[0][0]
-        assert "LOWER(c.CNAME) LIKE '%frontend%'" in sql_call
-        assert "LOWER(c.DESCRIPTION) LIKE '%frontend%'" in sql_call
-        assert "LOWER(c.CNAME) LIKE '%backend%'" in sql_call
-        assert "LOWER(c.DESCRIPTION) LIKE '%backend%'" in sql_call
+        assert sql_call.count("(c.CNAME ILIKE ? OR c.DESCRIPTION ILIKE ?)") == 2
         assert " OR " in sql_call
+        assert mock_dependencies['query'].call_args.kwargs['params'] == [
+            'PROJECT', '1', 'Open', '%frontend%', '%frontend%', '%backend%', '%backend%'
+        ]
 
     @pytest.mark.asyncio
     async def test_list_jira_issues_component_aggregation_dedup(self, mock_mcp, mock_dependencies):
@@ -502,7 +547,7 @@ class TestRegisterTools:
         ]
 
         # Map minimal fields regardless of the internal columns list
-        def mock_format_side_effect(row, columns):
+        def mock_format_side_effect(row, columns, ts_indices=None):
             # Only provide fields used by aggregation logic
             return {
                 'ID': row[0],
@@ -523,13 +568,36 @@ class TestRegisterTools:
         assert issue['component'] == ['frontend', 'backend']
         assert issue['component_name'] == 'frontend'
 
+    @pytest.mark.asyncio
+    async def test_list_jira_issues_resolves_timestamp_columns_once(self, mock_mcp, mock_dependencies):
+        """The timestamp column indices are computed once per result set, not per row"""
+        mock_dependencies['query'].return_value = [
+            ['1', 'PROJ-1'],
+            ['2', 'PROJ-2'],
+            ['3', 'PROJ-3'],
+        ]
+        mock_dependencies['format'].side_effect = lambda row, columns, ts_indices=None: {
+            'ID': row[0],
+            'ISSUE_KEY': row[1],
+        }
+
+        with patch('tools._timestamp_indices', return_value=frozenset({8})) as mock_indices:
+            register_tools(mock_mcp)
+            list_jira_issues = mock_mcp._registered_tools[0]
+            result = await list_jira_issues(project='PROJ')
+
+        assert result['total_returned'] == 3
+        mock_indices.assert_called_once()
+        for format_call in mock_dependencies['format'].call_args_list:
+            assert format_call.args[2] == frozenset({8})
+
     @pytest.mark.asyncio
     async def test_list_jira_issues_skips_rows_with_missing_id(self, mock_mcp, mock_dependencies):
         """Ensure rows with missing ID are safely skipped (branch coverage for continue)."""
         # One row returned, but formatted row has ID=None to trigger skip
         mock_dependencies['query'].return_value = [["ignored"]]
 
-        def mock_format_side_effect(row, columns):
+        def mock_format_side_effect(row, columns, ts_indices=None):
             return {"ID": None}
 
         mock_dependencies['format'].side_effect = mock_format_side_effect
@@ -647,7 +715,8 @@ class TestRegisterTools:
         # Verify SQL conditions include issue key filter
         mock_dependencies['query'].assert_called_once()
         sql_call = mock_dependencies['query'].call_args[0][0]
-        assert "i.ISSUE_KEY IN ('TEST-123')" in sql_call
+        assert "i.ISSUE_KEY IN (?)" in sql_call
+        assert mock_dependencies['query'].call_args.kwargs['params'] == ['TEST-123']
         
         # Verify filters_applied includes issue_keys
         assert result['filters_applied']['issue_keys'] == ['TEST-123']
@@ -667,7 +736,8 @@ class TestRegisterTools:
         # Verify SQL conditions include all issue keys
         mock_dependencies['query'].assert_called_once()
         sql_call = mock_dependencies['query'].call_args[0][0]
-        assert "i.ISSUE_KEY IN ('TEST-123', 'PROJ-456', 'BUG-789')" in sql_call
+        assert "i.ISSUE_KEY IN (?, ?, ?)" in sql_call
+        assert mock_dependencies['query'].call_args.kwargs['params'] == issue_keys
         
         # Verify filters_applied includes all issue_keys
         assert result['filters_applied']['issue_keys'] == issue_keys
@@ -691,10 +761,11 @@ class TestRegisterTools:
         # Verify SQL conditions include all filters
         mock_dependencies['query'].assert_called_once()
         sql_call = mock_dependencies['query'].call_args[0][0]
-        assert "i.ISSUE_KEY IN ('TEST-123', 'TEST-456')" in sql_call
-        assert "i.PROJECT = 'TEST'" in sql_call
-        assert "i.ISSUESTATUS = 'Open'" in sql_call
-        assert "i.PRIORITY = 'High'" in sql_call
+        assert "i.ISSUE_KEY IN (?, ?)" in sql_call
+        assert "i.PROJECT = ?" in sql_call
+        assert "i.ISSUESTATUS = ?" in sql_call
+        assert "i.PRIORITY = ?" in sql_call
+        assert mock_dependencies['query'].call_args.kwargs['params'] == ['TEST-123', 'TEST-456', 'TEST', 'Open', 'High']
         
         # Verify filters_applied includes all parameters
         assert result['filters_applied']['issue_keys'] == ['TEST-123', 'TEST-456']
@@ -719,7 +790,8 @@ class TestRegisterTools:
         mock_dependencies['query'].assert_called_once()
         sql_call = mock_dependencies['query'].call_args[0][0]
         assert "i.ISSUE_KEY IN" not in sql_call
-        assert "i.PROJECT = 'TEST'" in sql_call
+        assert "i.PROJECT = ?" in sql_call
+        assert mock_dependencies['query'].call_args.kwargs['params'] == ['TEST']
         
         # Verify filters_applied includes empty issue_keys
         assert result['filters_applied']['issue_keys'] == []
@@ -727,7 +799,7 @@ class TestRegisterTools:
 
     @pytest.mark.asyncio
     async def test_list_jira_issues_issue_keys_sql_sanitization(self, mock_mcp, mock_dependencies):
-        """Test that issue_keys are properly sanitized for SQL injection protection"""
+        """Test that issue_keys are bound as parameters for SQL injection protection"""
         mock_dependencies['query'].return_value = []
         
         register_tools(mock_mcp)
@@ -737,15 +809,12 @@ class TestRegisterTools:
         issue_keys = ["TEST-123", "PROJ'456", "BUG\"789"]
         result = await list_jira_issues(issue_keys=issue_keys)
         
-        # Verify sanitize_sql_value was called for each issue key
-        mock_dependencies['sanitize'].assert_any_call("TEST-123")
-        mock_dependencies['sanitize'].assert_any_call("PROJ'456")
-        mock_dependencies['sanitize'].assert_any_call("BUG\"789")
-        
-        # Verify SQL contains sanitized values
+        # Verify the keys are passed as bind parameters, never interpolated into SQL
         mock_dependencies['query'].assert_called_once()
         sql_call = mock_dependencies['query'].call_args[0][0]
-        assert "i.ISSUE_KEY IN" in sql_call
+        assert "i.ISSUE_KEY IN (?, ?, ?)" in sql_call
+        assert "PROJ'456" not in sql_call
+        assert mock_dependencies['query'].call_args.kwargs['params'] == issue_keys
 
     @pytest.mark.asyncio
     async def test_list_jira_issues_large_timeframe(self, mock_mcp, mock_dependencies):
@@ -930,8 +999,9 @@ class TestRegisterTools:
         # Verify SQL conditions include version filters
         mock_dependencies['query'].assert_called_once()
         sql_call = mock_dependencies['query'].call_args[0][0]
-        assert "LOWER(veragg.FIX_VERSIONS) LIKE '%v1.2.3%'" in sql_call
-        assert "LOWER(veragg.AFFECTS_VERSIONS) LIKE '%v1.1.0%'" in sql_call
+        assert "veragg.FIX_VERSIONS ILIKE ?" in sql_call
+        assert "veragg.AFFECTS_VERSIONS ILIKE ?" in sql_call
+        assert mock_dependencies['query'].call_args.kwargs['params'] == ['TEST', '%v1.2.3%', '%v1.1.0%']
         
         # Verify filters_applied includes version filters
         assert result['filters_applied']['fixed_version'] == 'v1.2.3'
@@ -954,8 +1024,9 @@ class TestRegisterTools:
         # Verify SQL conditions include only fixed_version filter
         mock_dependencies['query'].assert_called_once()
         sql_call = mock_dependencies['query'].call_args[0][0]
-        assert "LOWER(veragg.FIX_VERSIONS) LIKE '%v2.0%'" in sql_call
-        assert "LOWER(veragg.AFFECTS_VERSIONS) LIKE" not in sql_call
+        assert "veragg.FIX_VERSIONS ILIKE ?" in sql_call
+        assert "veragg.AFFECTS_VERSIONS ILIKE" not in sql_call
+        assert mock_dependencies['query'].call_args.kwargs['params'] == ['TEST', '%v2.0%']
         
         # Verify filters_applied includes only specified filter
         assert result['filters_applied']['fixed_version'] == 'v2.0'
@@ -986,10 +1057,12 @@ class TestConcurrentProcessingIntegration:
         with patch('tools.get_snowflake_token') as mock_token, \
              patch('tools.execute_snowflake_query') as mock_query, \
              patch('tools.get_issue_enrichment_data_concurrent') as mock_concurrent, \
+             patch('tools.get_issue_links') as mock_links, \
              patch('tools.track_concurrent_operation') as mock_track, \
              patch('tools.format_snowflake_row') as mock_format:
             
             mock_token.return_value = 'test_token'
+            mock_links.return_value = {}
             # Set default format return value
             mock_format.return_value = {
                 'ID': '123', 'ISSUE_KEY': 'TEST-1', 'PROJECT': 'PROJECT', 'ISSUENUM': '1',
@@ -1005,26 +1078,26 @@ class TestConcurrentProcessingIntegration:
                 'token': mock_token,
                 'query': mock_query,
                 'concurrent': mock_concurrent,
+                'links': mock_links,
                 'track': mock_track,
                 'format': mock_format
             }
 
     @pytest.mark.asyncio
-    async def test_list_jira_issues_uses_concurrent_processing(self, mock_mcp_with_concurrent, mock_concurrent_dependencies):
-        """Test that list_jira_issues uses concurrent processing for enrichment"""
+    async def test_list_jira_issues_enrichment(self, mock_mcp_with_concurrent, mock_concurrent_dependencies):
+        """Test that list_jira_issues reads labels from the query and fetches only links"""
         # Setup mocks
         mock_concurrent_dependencies['query'].return_value = [
             ["123", "TEST-1", "PROJECT", "1", "Bug", "Test issue", "Short desc", "Full description",
              "High", "Open", None, "2024-01-01", "2024-01-02", None, None, 0, 0, "test", "comp", "v1.0",
              "Test Component", "Test Component Desc", "N", "N"]
         ]
+        mock_concurrent_dependencies['format'].return_value = {
+            **mock_concurrent_dependencies['format'].return_value,
+            'LABEL_NAMES': '[\n  "bug",\n  "urgent||triage",\n  "bug"\n]'
+        }
         
-        mock_concurrent_dependencies['concurrent'].return_value = (
-            {"123": ["bug", "urgent"]},  # labels
-            {"123": [{"id": "c1", "body": "comment"}]},  # comments
-            {"123": [{"id": "l1", "type": "blocks"}]},  # links
-            {"TEST-1": [{"from_status": "New", "to_status": "Open"}]}  # status_changes
-        )
+        mock_concurrent_dependencies['links'].return_value = {"123": [{"id": "l1", "type": "blocks"}]}
         
         register_tools(mock_mcp_with_concurrent)
         list_jira_issues = mock_mcp_with_concurrent._registered_tools[0]
@@ -1032,14 +1105,19 @@ class TestConcurrentProcessingIntegration:
         # Execute the function
         result = await list_jira_issues(project="TEST")
         
-        # Verify concurrent processing was used
-        mock_concurrent_dependencies['concurrent'].assert_called_once()
+        # Labels are aggregated in the main query, so only links need a follow-up query
+        mock_concurrent_dependencies['concurrent'].assert_not_called()
+        mock_concurrent_dependencies['links'].assert_called_once_with(["123"], 'test_token')
         mock_concurrent_dependencies['track'].assert_called_with("issue_enrichment")
+        sql_call = mock_concurrent_dependencies['query'].call_args[0][0]
+        assert "labelagg.LABEL_NAMES" in sql_call
+        assert "JIRA_LABEL_RHAI" in sql_call
         
         # Verify enrichment data was added to issues
         assert len(result['issues']) == 1
         issue = result['issues'][0]
-        assert issue['labels'] == ["bug", "urgent"]
+        # Labels are decoded as an array, so '||' inside a label and repeats are kept as stored
+        assert issue['labels'] == ["bug", "urgent||triage", "bug"]
         assert issue['links'] == [{"id": "l1", "type": "blocks"}]
         # Comments should not be included in list view
         assert 'comments' not in issue or issue.get('comments') == []
@@ -1186,22 +1264,22 @@ class TestGetJiraIssuesBySprint:
         with patch('tools.get_snowflake_token') as mock_token, \
              patch('tools.execute_snowflake_query') as mock_query, \
              patch('tools.get_issue_enrichment_data_concurrent') as mock_enrichment, \
+             patch('tools.get_issue_links') as mock_links, \
              patch('tools.format_snowflake_row') as mock_format, \
-             patch('tools.sanitize_sql_value') as mock_sanitize, \
              patch('tools.track_concurrent_operation') as mock_track:
             
             mock_token.return_value = 'test_token'
             mock_query.return_value = []
             mock_enrichment.return_value = ({}, {}, {}, {})  # labels, comments, links, status_changes
+            mock_links.return_value = {}
             mock_format.return_value = {}
-            mock_sanitize.side_effect = lambda x: str(x).replace("'", "''")
             
             yield {
                 'token': mock_token,
                 'query': mock_query,
                 'enrichment': mock_enrichment,
+                'links': mock_links,
                 'format': mock_format,
-                'sanitize': mock_sanitize,
                 'track': mock_track
             }
 
@@ -1274,9 +1352,10 @@ class TestGetJiraIssuesBySprint:
         # Verify SQL conditions were built correctly
         mock_dependencies['query'].assert_called_once()
         sql_call = mock_dependencies['query'].call_args[0][0]
-        assert "s.name = 'Sprint 256'" in sql_call
-        assert "i.PROJECT = 'TEST'" in sql_call
+        assert "s.name = ?" in sql_call
+        assert "i.PROJECT = ?" in sql_call
         assert "LIMIT 25" in sql_call
+        assert mock_dependencies['query'].call_args.kwargs['params'] == ['Sprint 256', 'TEST']
         
         # Verify filters_applied includes project filter
         assert result['filters_applied']['sprint_name'] == 'Sprint 256'
@@ -1309,16 +1388,20 @@ class TestGetJiraIssuesBySprint:
         assert "LISTAGG(DISTINCT c2.CNAME, '||')" in sql_call
         assert "LISTAGG(CASE WHEN na3.ASSOCIATION_TYPE = 'IssueFixVersion'" in sql_call
         
+        # Only the truncated description is selected
+        assert sql_call.count("i.DESCRIPTION") == 1
+
         # Check for sprint fields
         assert "cfv.stringvalue as SPRINT_ID" in sql_call
         assert "s.name as SPRINT_NAME" in sql_call
         
         # Check WHERE clause
-        assert "WHERE s.name = 'Vanguard Sprint 6'" in sql_call
+        assert "WHERE s.name = ?" in sql_call
+        assert mock_dependencies['query'].call_args.kwargs['params'] == ['Vanguard Sprint 6']
 
     @pytest.mark.asyncio
     async def test_get_jira_issues_by_sprint_sql_sanitization(self, mock_mcp, mock_dependencies):
-        """Test that sprint name and project are properly sanitized"""
+        """Test that sprint name and project are bound as parameters"""
         mock_dependencies['query'].return_value = []
         
         register_tools(mock_mcp)
@@ -1330,9 +1413,10 @@ class TestGetJiraIssuesBySprint:
         
         result = await get_jira_issues_by_sprint(sprint_name, project=project)
         
-        # Verify sanitize_sql_value was called for sprint name and project
-        mock_dependencies['sanitize'].assert_any_call(sprint_name)
-        mock_dependencies['sanitize'].assert_any_call(project.upper())
+        # Verify values are passed as bind parameters, never interpolated into SQL
+        sql_call = mock_dependencies['query'].call_args[0][0]
+        assert "Sprint 'Test' 256" not in sql_call
+        assert mock_dependencies['query'].call_args.kwargs['params'] == [sprint_name, project.upper()]
 
     @pytest.mark.asyncio
     async def test_get_jira_issues_by_sprint_enrichment_tracking(self, mock_mcp, mock_dependencies):
@@ -1344,26 +1428,24 @@ class TestGetJiraIssuesBySprint:
         ]
         
         mock_dependencies['format'].return_value = {
-            'ID': '123', 'ISSUE_KEY': 'TEST-1', 'SPRINT_ID': '256', 'SPRINT_NAME': 'Sprint 256'
+            'ID': '123', 'ISSUE_KEY': 'TEST-1', 'SPRINT_ID': '256', 'SPRINT_NAME': 'Sprint 256',
+            'LABEL_NAMES': '["urgent"]'
         }
         
-        mock_dependencies['enrichment'].return_value = (
-            {'123': ['urgent']},  # labels
-            {'123': []},  # comments  
-            {'123': []},  # links
-            {}  # status_changes
-        )
+        mock_dependencies['links'].return_value = {'123': []}
         
         register_tools(mock_mcp)
         get_jira_issues_by_sprint = mock_mcp._registered_tools[4]
         
         result = await get_jira_issues_by_sprint('Sprint 256')
         
-        # Verify concurrent operation tracking
+        # Verify enrichment operation tracking
         mock_dependencies['track'].assert_called_with("sprint_issue_enrichment")
         
-        # Verify enrichment was called
-        mock_dependencies['enrichment'].assert_called_once()
+        # Labels come from the main query; only links are fetched separately
+        mock_dependencies['links'].assert_called_once_with(['123'], 'test_token')
+        mock_dependencies['enrichment'].assert_not_called()
+        assert result['issues'][0]['labels'] == ['urgent']
 
     @pytest.mark.asyncio
     async def test_get_jira_issues_by_sprint_component_aggregation(self, mock_mcp, mock_dependencies):
@@ -1413,7 +1495,7 @@ class TestGetJiraIssuesBySprint:
              '256', 'Sprint 256', 'frontend||backend', 'v1.0', 'v0.9']
         ]
         
-        def mock_format_side_effect(row, columns):
+        def mock_format_side_effect(row, columns, ts_indices=None):
             return {
                 'ID': row[0], 'ISSUE_KEY': row[1], 'PROJECT': row[2],
                 'COMPONENT_NAMES': row[22], 'SPRINT_ID': row[20], 'SPRINT_NAME': row[21]
@@ -1436,7 +1518,7 @@ class TestGetJiraIssuesBySprint:
         """Test that rows with missing ID are properly skipped"""
         mock_dependencies['query'].return_value = [["ignored"]]
         
-        def mock_format_side_effect(row, columns):
+        def mock_format_side_effect(row, columns, ts_indices=None):
             return {"ID": None}  # Malformed row with no ID
         
         mock_dependencies['format'].side_effect = mock_format_side_effect